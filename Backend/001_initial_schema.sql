@@ -68,7 +68,7 @@ CREATE TABLE notes (
     title           VARCHAR(500) NOT NULL,
     plain_text      TEXT,                       -- stripped text for search & AI
     enml_content    TEXT,                       -- original ENML for rendering
-    content_hash    VARCHAR(32),                -- MD5 for change detection
+    content_hash    VARCHAR(32),                -- BLAKE2b-128 for change detection
     content_length  INT DEFAULT 0,
 
     -- Metadata
@@ -1,40 +1,76 @@
 # backend/app/main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.config import get_settings
 from app.routers import evernote, stock
+from app.services.response_cache import init_cache, close_cache
 
 settings = get_settings()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 응답 캐시 (Redis) 커넥션 풀
+    await init_cache(settings.REDIS_URL)
+    yield
+    await close_cache()
+
+
 app = FastAPI(
     title="Research Platform API",
     version="0.1.0",
     description="기업 리서치 통합 플랫폼 백엔드",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    # 라우터는 모두 api sub-app에 있음 → 문서는 {API_PREFIX}/docs, {API_PREFIX}/openapi.json
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
 )
 
-# CORS
-app.add_middleware(
+# API sub-app — CORS는 여기에만 적용 (/health 등 루트 경로는 미들웨어 없음)
+# (mount된 sub-app의 lifespan은 실행되지 않으므로 lifespan은 루트 app에 유지)
+api = FastAPI(
+    title="Research Platform API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
+
+# CORS — 실제 사용하는 메서드/헤더만, preflight는 브라우저가 1일 캐시
+api.add_middleware(
     CORSMiddleware,
     allow_origins=[settings.FRONTEND_URL, "http://localhost:5173", "http://localhost:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH", "OPTIONS"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,
 )
 
+# gzip — /prices, /indicators 등 수치 배열 JSON은 5~10배 압축
+# (1KB 미만은 압축 이득보다 CPU 비용이 커서 제외, 캐시 응답은 이미 압축된 bytes)
+api.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Routers
-app.include_router(evernote.router, prefix=settings.API_PREFIX)
-app.include_router(stock.router, prefix=settings.API_PREFIX)
+api.include_router(evernote.router)
+api.include_router(stock.router)
+
+app.mount(settings.API_PREFIX, api)
 
 
-@app.get("/health")
+# liveness probe — 상수 문자열을 text/plain으로 (JSON 인코딩 없음)
+# Response 객체는 요청마다 새로 생성 (공유 인스턴스에 background/헤더가 붙지 않도록)
+@app.get("/health", response_class=PlainTextResponse)
 async def health():
-    return {"status": "ok", "version": "0.1.0"}
+    return "ok"
 
 
 # ─── Future routers (Phase 2-3) ──────────────────────────
 # from app.routers import stocks, news, telegram, reports
-# app.include_router(stocks.router, prefix=settings.API_PREFIX)
-# app.include_router(news.router, prefix=settings.API_PREFIX)
-# app.include_router(telegram.router, prefix=settings.API_PREFIX)
-# app.include_router(reports.router, prefix=settings.API_PREFIX)
+# api.include_router(stocks.router)
+# api.include_router(news.router)
+# api.include_router(telegram.router)
+# api.include_router(reports.router)
@@ -3,7 +3,7 @@ from sqlalchemy import (
     Column, Integer, BigInteger, String, Date, Boolean,
     Numeric, ForeignKey, DateTime, UniqueConstraint, Index
 )
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text, table, column
 from sqlalchemy.orm import relationship, DeclarativeBase
 
 
@@ -28,7 +28,18 @@ class Company(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    prices = relationship("StockPrice", back_populates="company", lazy="dynamic")
+    __table_args__ = (
+        # list_companies(market=...) 의 WHERE/ORDER BY와 일치
+        Index("ix_companies_active_market", "market", "stock_code", postgresql_where=text("is_active IS TRUE")),
+        # 종목명/코드 부분 검색(ILIKE '%q%') — pg_trgm 확장 필요
+        Index("ix_companies_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_companies_code_trgm", "stock_code", postgresql_using="gin", postgresql_ops={"stock_code": "gin_trgm_ops"}),
+        # 숫자 코드 prefix 검색(LIKE 'q%') — collation과 무관하게 btree 사용
+        Index("ix_companies_code_prefix", "stock_code", postgresql_ops={"stock_code": "text_pattern_ops"}),
+    )
+
+    # 기본 lazy 로딩 — 목록 조회 시 selectinload(Company.prices) 명시할 것
+    prices = relationship("StockPrice", back_populates="company")
 
 
 class StockPrice(Base):
@@ -55,7 +66,15 @@ class StockPrice(Base):
 
     __table_args__ = (
         UniqueConstraint("company_id", "trade_date", name="uq_stock_prices_company_date"),
-        Index("idx_stock_prices_lookup", "company_id", "trade_date"),
+        # 기간 조회(get_prices / 보조지표)를 heap fetch 없는 index-only scan으로
+        # DESC 정렬이지만 역방향 스캔으로 ASC 조회도 처리
+        Index(
+            "ix_stock_prices_company_date_covering", company_id, trade_date.desc(),
+            postgresql_include=[
+                "open", "high", "low", "close", "volume",
+                "trading_value", "market_cap", "change_pct",
+            ],
+        ),
     )
 
 
@@ -71,3 +90,16 @@ class StockSyncLog(Base):
     error_message = Column(String)
     started_at = Column(DateTime(timezone=True), server_default=func.now())
     finished_at = Column(DateTime(timezone=True))
+
+
+# 종목별 최신 일봉 스냅샷 (materialized view, migrations/010_mv_latest_quote.sql)
+# metadata에 등록하지 않음 → create_all 대상 아님. sync_today에서 REFRESH.
+latest_quote = table(
+    "mv_latest_quote",
+    column("company_id", Integer),
+    column("trade_date", Date),
+    column("close", Integer),
+    column("volume", BigInteger),
+    column("change_pct", Numeric(8, 4)),
+    column("market_cap", BigInteger),
+)
@@ -5,8 +5,8 @@
 GET  /api/v1/stock/companies                    종목 목록
 GET  /api/v1/stock/companies/{code}             종목 상세
 GET  /api/v1/stock/prices/{code}                일봉 OHLCV + 거래대금
-GET  /api/v1/stock/indicators/{code}            보조지표 계산
 GET  /api/v1/stock/indicators/catalog           지표 카탈로그
+GET  /api/v1/stock/indicators/{code}            보조지표 계산
 POST /api/v1/stock/sync/listing                 종목 마스터 동기화
 POST /api/v1/stock/sync/prices                  주가 데이터 수집
 POST /api/v1/stock/sync/today                   당일 데이터 수집
@@ -15,16 +15,23 @@ POST /api/v1/stock/sync/today                   당일 데이터 수집
 from datetime import date, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, or_, func, cast, Float
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.models.stock import Company, StockPrice
+from app.models.stock import Company, StockPrice, latest_quote
+from app.services.response_cache import cached_json
 from app.services.stock_collector import StockCollector
 from app.services.technical_indicators import TechnicalIndicatorService
 
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow 미설치 → JSON 응답만
+    pa = None
+
 router = APIRouter(prefix="/stock", tags=["Stock Data"])
 
 
@@ -35,6 +42,7 @@ class SyncPricesRequest(BaseModel):
     end_date: Optional[str] = None
     market: Optional[str] = None         # KOSPI / KOSDAQ
     limit: Optional[int] = None          # 테스트용
+    incremental: bool = True             # False = start_date부터 전체 재수집 (과거 구간 백필/수정주가 반영)
 
 class IndicatorRequest(BaseModel):
     indicators: list[str] = ["MA", "RSI", "MACD", "BB", "OBV"]
@@ -44,32 +52,62 @@ class IndicatorRequest(BaseModel):
 # ─── 종목 목록 ──────────────────────────────────────────────
 @router.get("/companies")
 async def list_companies(
+    request: Request,
     market: Optional[str] = Query(None, description="KOSPI / KOSDAQ"),
     search: Optional[str] = Query(None, description="종목명/코드 검색"),
     limit: int = Query(100, le=3000),
     offset: int = Query(0),
     db: AsyncSession = Depends(get_db),
 ):
-    """상장 종목 목록 조회"""
-    query = select(Company).where(Company.is_active == True)
+    """상장 종목 목록 조회 (종목 목록은 하루 한 번 갱신 → 60초 캐시)"""
+    return await cached_json(
+        request, "companies", ttl=60,
+        build=lambda: _list_companies(db, market, search, limit, offset),
+    )
+
+
+async def _list_companies(
+    db: AsyncSession,
+    market: Optional[str],
+    search: Optional[str],
+    limit: int,
+    offset: int,
+) -> dict:
+    conditions = [Company.is_active == True]
 
     if market:
-        query = query.where(Company.market == market)
+        conditions.append(Company.market == market)
 
     if search:
-        query = query.where(
-            (Company.name.ilike(f"%{search}%")) |
-            (Company.stock_code.ilike(f"%{search}%"))
-        )
-
-    # 총 개수
-    count_q = select(func.count()).select_from(query.subquery())
+        if search.isdigit():
+            # 종목코드 입력 → prefix 검색 (ix_companies_code_prefix)
+            conditions.append(Company.stock_code.like(f"{search}%"))
+        else:
+            # 부분 검색 → pg_trgm GIN 인덱스 (ix_companies_*_trgm)
+            conditions.append(or_(
+                Company.name.ilike(f"%{search}%"),
+                Company.stock_code.ilike(f"%{search}%"),
+            ))
+
+    # 총 개수 — 같은 WHERE로 직접 COUNT (subquery 래핑 없음)
+    count_q = select(func.count(Company.id)).where(*conditions)
     total = (await db.execute(count_q)).scalar()
 
-    # 결과
-    query = query.order_by(Company.stock_code).offset(offset).limit(limit)
+    # 결과 — 최신 종가/등락률/거래량은 mv_latest_quote에서 (행마다 /prices 호출 불필요)
+    query = (
+        select(
+            Company.stock_code, Company.name, Company.market,
+            Company.sector, Company.market_cap,
+            latest_quote.c.trade_date, latest_quote.c.close,
+            latest_quote.c.change_pct, latest_quote.c.volume,
+        )
+        .outerjoin(latest_quote, latest_quote.c.company_id == Company.id)
+        .where(*conditions)
+        .order_by(Company.stock_code)
+        .offset(offset)
+        .limit(limit)
+    )
     result = await db.execute(query)
-    companies = result.scalars().all()
 
     return {
         "total": total,
@@ -80,8 +118,12 @@ async def list_companies(
                 "market": c.market,
                 "sector": c.sector,
                 "market_cap": c.market_cap,
+                "trade_date": c.trade_date,
+                "close": c.close,
+                "change_pct": float(c.change_pct) if c.change_pct is not None else None,
+                "volume": c.volume,
             }
-            for c in companies
+            for c in result.all()
         ],
     }
 
@@ -111,8 +153,21 @@ async def get_company(stock_code: str, db: AsyncSession = Depends(get_db)):
 
 
 # ─── 일봉 데이터 ────────────────────────────────────────────
+# 응답 필드 (짧은 키). t = 거래일 00:00 UTC epoch milliseconds
+_PRICE_COLS = ("t", "o", "h", "l", "c", "v", "tv", "mc", "pct")
+_PRICE_FIELDS = {
+    "t": "trade_date (epoch ms, UTC)", "o": "open", "h": "high", "l": "low",
+    "c": "close", "v": "volume", "tv": "trading_value", "mc": "market_cap",
+    "pct": "change_pct",
+}
+_MS_PER_DAY = 86_400_000
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
 @router.get("/prices/{stock_code}")
 async def get_prices(
+    request: Request,
     stock_code: str,
     start: str = Query(default=None, description="시작일 (YYYY-MM-DD)"),
     end: str = Query(default=None, description="종료일 (YYYY-MM-DD)"),
@@ -122,12 +177,18 @@ async def get_prices(
     """
     일봉 OHLCV + 거래대금 + 시가총액 조회.
     프론트엔드 캔들스틱 차트 데이터용.
+
+    data 행은 짧은 키(_PRICE_FIELDS 참고), 날짜는 epoch ms 정수
+    → 차트 라이브러리(ECharts, Lightweight-Charts 등)에 변환 없이 전달.
+
+    Accept: application/vnd.apache.arrow.stream → Arrow IPC stream (pyarrow 설치 시)
     """
-    # 종목 확인
+    # 종목 확인 (필요한 컬럼만)
     result = await db.execute(
-        select(Company).where(Company.stock_code == stock_code)
+        select(Company.id, Company.name, Company.market)
+        .where(Company.stock_code == stock_code)
     )
-    company = result.scalar_one_or_none()
+    company = result.one_or_none()
     if not company:
         raise HTTPException(404, f"종목 {stock_code} 없음")
 
@@ -137,42 +198,61 @@ async def get_prices(
     if start is None:
         start = (date.today() - timedelta(days=limit)).isoformat()
 
+    # Core 컬럼 select → ORM 객체 생성/identity map 없이 Row 튜플
+    # (ix_stock_prices_company_date_covering으로 index-only scan)
     query = (
-        select(StockPrice)
+        select(
+            StockPrice.trade_date, StockPrice.open, StockPrice.high,
+            StockPrice.low, StockPrice.close, StockPrice.volume,
+            StockPrice.trading_value, StockPrice.market_cap,
+            cast(StockPrice.change_pct, Float),   # Decimal 대신 float로 받음
+        )
         .where(
-            and_(
-                StockPrice.company_id == company.id,
-                StockPrice.trade_date >= start,
-                StockPrice.trade_date <= end,
-            )
+            StockPrice.company_id == company.id,
+            StockPrice.trade_date >= start,
+            StockPrice.trade_date <= end,
         )
         .order_by(StockPrice.trade_date.asc())
         .limit(limit)
     )
+    rows = (await db.execute(query)).all()
 
-    result = await db.execute(query)
-    rows = result.scalars().all()
+    # 날짜 → epoch ms (date 포맷팅 없이 정수 연산)
+    data = [
+        ((d.toordinal() - _EPOCH_ORDINAL) * _MS_PER_DAY, *rest)
+        for d, *rest in rows
+    ]
 
-    return {
+    if pa is not None and _ARROW_MEDIA_TYPE in request.headers.get("accept", ""):
+        table = pa.Table.from_pydict(
+            {col: [r[i] for r in data] for i, col in enumerate(_PRICE_COLS)}
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return Response(sink.getvalue().to_pybytes(), media_type=_ARROW_MEDIA_TYPE)
+
+    # ORJSONResponse 직접 반환 → jsonable_encoder 단계 생략
+    return ORJSONResponse({
         "stock_code": stock_code,
         "name": company.name,
         "market": company.market,
-        "count": len(rows),
-        "data": [
-            {
-                "date": r.trade_date.isoformat(),
-                "open": r.open,
-                "high": r.high,
-                "low": r.low,
-                "close": r.close,
-                "volume": r.volume,
-                "trading_value": r.trading_value,
-                "market_cap": r.market_cap,
-                "change_pct": float(r.change_pct) if r.change_pct else None,
-            }
-            for r in rows
-        ],
-    }
+        "count": len(data),
+        "time_unit": "ms",
+        "fields": _PRICE_FIELDS,
+        "data": [dict(zip(_PRICE_COLS, r)) for r in data],
+    })
+
+
+# ─── 지표 카탈로그 ──────────────────────────────────────────
+# /indicators/{stock_code}보다 먼저 등록해야 함 (Starlette는 등록 순서대로 매칭)
+@router.get("/indicators/catalog")
+async def indicator_catalog(request: Request):
+    """사용 가능한 기술적 지표 목록과 파라미터 정보 (정적 → 1일 캐시)"""
+    async def _build():
+        return TechnicalIndicatorService.get_catalog()
+
+    return await cached_json(request, "indicator_catalog", ttl=86400, build=_build)
 
 
 # ─── 보조지표 계산 ──────────────────────────────────────────
@@ -229,13 +309,6 @@ async def get_indicators(
         raise HTTPException(404, str(e))
 
 
-# ─── 지표 카탈로그 ──────────────────────────────────────────
-@router.get("/indicators/catalog")
-async def indicator_catalog():
-    """사용 가능한 기술적 지표 목록과 파라미터 정보"""
-    return TechnicalIndicatorService.get_catalog()
-
-
 # ─── 데이터 동기화 (관리자용) ────────────────────────────────
 @router.post("/sync/listing")
 async def sync_listing(db: AsyncSession = Depends(get_db)):
@@ -255,11 +328,13 @@ async def sync_prices(
 
     if req.stock_code:
         result = await collector.sync_prices(
-            req.stock_code, req.start_date, req.end_date
+            req.stock_code, req.start_date, req.end_date,
+            incremental=req.incremental,
         )
     else:
         result = await collector.sync_all_prices(
-            req.start_date, req.end_date, req.market, req.limit
+            req.start_date, req.end_date, req.market, req.limit,
+            incremental=req.incremental,
         )
     return result
 
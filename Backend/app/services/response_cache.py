@@ -0,0 +1,112 @@
+# backend/app/services/response_cache.py
+"""
+Redis 기반 API 응답 캐시
+
+- 직렬화 + gzip 압축한 JSON bytes를 그대로 저장 → hit 시 DB 조회/직렬화/압축 없이 반환
+  (Accept-Encoding: gzip이면 Content-Encoding: gzip으로 그대로 전송,
+   GZipMiddleware는 Content-Encoding이 있는 응답을 다시 압축하지 않음)
+- ETag(W/"blake2b") + If-None-Match → 304, Cache-Control: public, max-age=ttl
+- REDIS_URL 미설정 또는 Redis 장애 시 캐시 없이 그대로 계산
+
+사용법:
+    return await cached_json(request, "companies", ttl=60, build=lambda: _build(...))
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+try:
+    from redis import asyncio as aioredis
+except ImportError:  # redis 미설치 → 캐시 비활성
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+_redis = None
+
+
+# ─── 연결 관리 (app startup/shutdown) ──────────────────────────
+async def init_cache(url: str) -> None:
+    """Redis 커넥션 풀 생성. url이 비어 있으면 캐시 비활성."""
+    global _redis
+    if not url or aioredis is None:
+        logger.info("응답 캐시 비활성 (REDIS_URL 없음)")
+        return
+    _redis = aioredis.from_url(url)
+
+
+async def close_cache() -> None:
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+# ─── 캐시 조회/저장 ────────────────────────────────────────────
+def _cache_key(prefix: str, request: Request) -> str:
+    """쿼리 파라미터 순서와 무관한 캐시 키 (프로세스 간 동일해야 하므로 hash() 미사용)"""
+    params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    return f"cache:{prefix}:{request.url.path}?{params}"
+
+
+def _etag(body: bytes) -> str:
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _compress(body: bytes) -> bytes:
+    # mtime=0 → 같은 payload는 항상 같은 bytes (ETag 안정)
+    return gzip.compress(body, compresslevel=5, mtime=0)
+
+
+def _response(request: Request, gz_body: bytes, ttl: int) -> Response:
+    etag = _etag(gz_body)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={ttl}",
+        "Vary": "Accept-Encoding",
+    }
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(gz_body, media_type="application/json", headers=headers)
+    return Response(gzip.decompress(gz_body), media_type="application/json", headers=headers)
+
+
+async def cached_json(
+    request: Request,
+    key_prefix: str,
+    ttl: int,
+    build: Callable[[], Awaitable[Any]],
+) -> Response:
+    """
+    캐시된 JSON 응답 반환. miss면 build()로 payload를 만들어 gzip 압축 후 ttl초 동안 저장.
+    """
+    key = _cache_key(key_prefix, request)
+
+    if _redis is not None:
+        try:
+            body: Optional[bytes] = await _redis.get(key)
+            if body is not None:
+                return _response(request, body, ttl)
+        except Exception as e:
+            logger.warning(f"캐시 조회 실패 ({key}): {e}")
+
+    payload = await build()
+    body = _compress(json.dumps(
+        jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":")
+    ).encode())
+
+    if _redis is not None:
+        try:
+            await _redis.set(key, body, ex=ttl)
+        except Exception as e:
+            logger.warning(f"캐시 저장 실패 ({key}): {e}")
+
+    return _response(request, body, ttl)
@@ -12,32 +12,82 @@
 """
 
 import asyncio
+import atexit
+import functools
 import logging
 from datetime import datetime, date, timedelta
+from decimal import Decimal
 from typing import Optional
 
 import FinanceDataReader as fdr
+import pandas as pd
 from pykrx import stock as pykrx_stock
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, func, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
+from app.database import async_session
 from app.models.stock import Company, StockPrice, StockSyncLog
 
 logger = logging.getLogger(__name__)
 
-# pykrx는 동기 라이브러리이므로 thread pool에서 실행
+# pykrx/FDR은 동기 라이브러리이므로 thread pool에서 실행
+# HTTP 대기 위주(I/O bound) → 실제 호출 빈도는 아래 rate limiter가 제한하므로 worker는 넉넉히
 from concurrent.futures import ThreadPoolExecutor
 
-_thread_pool = ThreadPoolExecutor(max_workers=4)
+_thread_pool = ThreadPoolExecutor(
+    max_workers=get_settings().STOCK_IO_WORKERS, thread_name_prefix="pykrx"
+)
+atexit.register(_thread_pool.shutdown, wait=False)
 
+# sync_all_prices 동시 수집 종목 수
+PRICE_SYNC_CONCURRENCY = 8
 
-def _run_sync(func, *args, **kwargs):
-    """동기 함수를 asyncio에서 실행"""
-    import functools
-    loop = asyncio.get_event_loop()
-    return loop.run_in_executor(_thread_pool, functools.partial(func, *args, **kwargs))
+# 증분 수집 시 마지막 저장일보다 며칠 앞에서부터 다시 받음 (당일 정정/지연 반영분 덮어쓰기)
+INCREMENTAL_OVERLAP_DAYS = 3
+
+
+class _RateLimiter:
+    """
+    호출 빈도 제한 (초당 max_rate회). `async with limiter:` 로 사용.
+    슬롯만 예약하고 lock 밖에서 대기하므로 대기 중에도 다른 worker가 슬롯을 잡을 수 있음.
+    """
+
+    def __init__(self, max_rate: float, period: float = 1.0):
+        self._interval = period / max_rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+# 전 worker가 공유하는 호스트별 rate limit (종목 간 고정 sleep 대체)
+_pykrx_limiter = _RateLimiter(max_rate=2, period=1.0)
+_fdr_limiter = _RateLimiter(max_rate=5, period=1.0)
+
+# stock_prices 업서트 컬럼 (company_id, trade_date = 충돌 키)
+_PRICE_COLUMNS = [
+    "company_id", "trade_date", "open", "high", "low", "close", "volume",
+    "change_pct", "trading_value", "market_cap", "listed_shares",
+]
+
+
+async def _run_sync(func, *args, **kwargs):
+    """동기 함수를 공유 thread pool에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_thread_pool, functools.partial(func, *args, **kwargs))
 
 
 # ─── pykrx 날짜 포맷 변환 ────────────────────────────────────
@@ -56,6 +106,41 @@ def _to_iso_date(d) -> str:
     return f"{s[:4]}-{s[4:6]}-{s[6:8]}"
 
 
+def _listing_rows(krx_df) -> list[dict]:
+    """
+    FDR StockListing DataFrame → companies upsert용 dict 리스트.
+    6자리 종목코드만 남기고, 빈 sector/industry는 None.
+    """
+    def _text(col):
+        if col not in krx_df.columns:
+            return pd.Series("", index=krx_df.index)
+        return krx_df[col].fillna("").astype(str).str.strip()
+
+    codes = krx_df["Code"] if "Code" in krx_df.columns else krx_df.index.to_series(index=krx_df.index)
+    df = pd.DataFrame({
+        "stock_code": codes.fillna("").astype(str).str.strip(),
+        "name": _text("Name"),
+        "market": _text("Market"),
+        "sector": _text("Sector"),
+        "industry": _text("Industry"),
+    })
+    df = df[df["stock_code"].str.len() == 6]
+    # 같은 코드가 한 statement에 두 번 있으면 ON CONFLICT DO UPDATE 오류
+    df = df.drop_duplicates("stock_code", keep="last")
+
+    return [
+        dict(
+            stock_code=code,
+            name=name,
+            market=market,
+            sector=sector or None,
+            industry=industry or None,
+            is_active=True,
+        )
+        for code, name, market, sector, industry in df.itertuples(index=False, name=None)
+    ]
+
+
 # ═══════════════════════════════════════════════════════════════
 # StockCollector
 # ═══════════════════════════════════════════════════════════════
@@ -69,8 +154,10 @@ class StockCollector:
     3. sync_all_prices(start) → 전 종목 일봉 수집
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, session_factory=async_session):
         self.db = db
+        # sync_all_prices의 종목별 worker가 각자 세션을 열 때 사용
+        self.session_factory = session_factory
 
     # ─── 1. 종목 마스터 동기화 ────────────────────────────────
     async def sync_company_listing(self) -> dict:
@@ -90,43 +177,30 @@ class StockCollector:
                 raise ValueError("KRX 종목 리스트를 가져오지 못했습니다")
 
             log.target_count = len(krx_df)
+            rows = _listing_rows(krx_df)
             synced = 0
-            errors = 0
-
-            for _, row in krx_df.iterrows():
-                try:
-                    code = str(row.get("Code", row.name)).strip()
-                    if not code or len(code) != 6:
-                        continue
-
-                    name = str(row.get("Name", "")).strip()
-                    market = str(row.get("Market", "")).strip()
-                    sector = str(row.get("Sector", "")).strip() if "Sector" in row else None
-                    industry = str(row.get("Industry", "")).strip() if "Industry" in row else None
-
-                    stmt = pg_insert(Company).values(
-                        stock_code=code,
-                        name=name,
-                        market=market,
-                        sector=sector or None,
-                        industry=industry or None,
-                        is_active=True,
-                    ).on_conflict_do_update(
+
+            # 전 종목을 5000행 단위 multi-values upsert로 저장 (한 트랜잭션, 끝에 한 번 commit)
+            # Core statement만 실행 → batch마다 autoflush 검사 불필요
+            batch_size = 5000
+            with self.db.no_autoflush:
+                for i in range(0, len(rows), batch_size):
+                    stmt = pg_insert(Company).values(rows[i:i + batch_size])
+                    stmt = stmt.on_conflict_do_update(
                         index_elements=["stock_code"],
                         set_=dict(
-                            name=name,
-                            market=market,
-                            sector=sector or None,
-                            industry=industry or None,
+                            name=stmt.excluded.name,
+                            market=stmt.excluded.market,
+                            sector=stmt.excluded.sector,
+                            industry=stmt.excluded.industry,
                             is_active=True,
                             updated_at=datetime.utcnow(),
                         ),
                     )
-                    await self.db.execute(stmt)
-                    synced += 1
-                except Exception as e:
-                    errors += 1
-                    logger.warning(f"종목 저장 실패 {row.get('Code', '?')}: {e}")
+                    result = await self.db.execute(stmt)
+                    synced += result.rowcount
+
+            errors = len(rows) - synced
 
             await self.db.commit()
 
@@ -153,6 +227,11 @@ class StockCollector:
         stock_code: str,
         start_date: str = "2024-01-01",
         end_date: Optional[str] = None,
+        *,
+        company: Optional[Company] = None,
+        caps_map: Optional[dict[str, tuple]] = None,
+        last_dates: Optional[dict[int, date]] = None,
+        incremental: bool = True,
     ) -> dict:
         """
         개별 종목의 일봉 데이터를 수집하여 stock_prices에 저장.
@@ -161,123 +240,105 @@ class StockCollector:
         - FDR: OHLCV (수정주가), 등락률
         - pykrx get_market_ohlcv_by_date: 거래대금
         - pykrx get_market_cap: 시가총액, 상장주식수
+          (caps_map: _fetch_caps_map() 결과. 전 종목 수집 시 한 번만 조회해서 전달)
+
+        company: 이미 조회한 Company (self.db에 붙어 있어야 함). 넘기면 종목 조회 생략.
+
+        incremental=True면 이미 저장된 구간은 건너뜀:
+        start_date = max(start_date, 마지막 저장일 - INCREMENTAL_OVERLAP_DAYS)
+        (last_dates: _fetch_last_dates() 결과. 전 종목 수집 시 한 번만 조회해서 전달)
+        수정주가 재반영 등 전체 재수집이 필요하면 incremental=False.
         """
         if end_date is None:
             end_date = date.today().isoformat()
 
-        # 1) company_id 조회
-        result = await self.db.execute(
-            select(Company).where(Company.stock_code == stock_code)
-        )
-        company = result.scalar_one_or_none()
+        # 1) company_id 조회 (전 종목 수집이면 caller가 넘겨준 객체 사용)
+        if company is None:
+            result = await self.db.execute(
+                select(Company).where(Company.stock_code == stock_code)
+            )
+            company = result.scalar_one_or_none()
         if not company:
             raise ValueError(f"종목 {stock_code}이 companies 테이블에 없습니다. sync_company_listing() 먼저 실행하세요.")
 
-        # 2) FDR에서 OHLCV 가져오기
-        ohlcv_df = await _run_sync(fdr.DataReader, stock_code, start_date, end_date)
+        # 2) 증분 수집 시작일
+        if incremental:
+            if last_dates is None:
+                last_date = (await self.db.execute(
+                    select(func.max(StockPrice.trade_date))
+                    .where(StockPrice.company_id == company.id)
+                )).scalar()
+            else:
+                last_date = last_dates.get(company.id)
+            if last_date is not None:
+                resume = last_date - timedelta(days=INCREMENTAL_OVERLAP_DAYS)
+                start = max(date.fromisoformat(_to_iso_date(start_date)), resume)
+                start_date = min(start, date.fromisoformat(_to_iso_date(end_date))).isoformat()
+
+        # 3) FDR에서 OHLCV 가져오기
+        async with _fdr_limiter:
+            ohlcv_df = await _run_sync(fdr.DataReader, stock_code, start_date, end_date)
         if ohlcv_df is None or ohlcv_df.empty:
             logger.warning(f"{stock_code}: FDR OHLCV 데이터 없음")
             return {"stock_code": stock_code, "synced": 0}
 
-        # 3) pykrx에서 거래대금 가져오기
+        # 4) pykrx에서 거래대금 가져오기
         p_start = _to_pykrx_date(start_date)
         p_end = _to_pykrx_date(end_date)
 
         try:
-            pykrx_ohlcv = await _run_sync(
-                pykrx_stock.get_market_ohlcv_by_date, p_start, p_end, stock_code
-            )
+            async with _pykrx_limiter:
+                pykrx_ohlcv = await _run_sync(
+                    pykrx_stock.get_market_ohlcv_by_date, p_start, p_end, stock_code
+                )
         except Exception as e:
             logger.warning(f"{stock_code}: pykrx OHLCV 실패 ({e}), 거래대금 없이 진행")
             pykrx_ohlcv = None
 
-        # 4) pykrx에서 시가총액 가져오기
-        try:
-            # get_market_cap는 개별 종목 기간 조회 불가 → 일별 전 종목 조회
-            # 대신 일봉 날짜별로 한번에 가져오기는 비효율적이므로,
-            # 최근 거래일 시총만 가져와서 캐시
-            today_str = _to_pykrx_date(date.today())
-            cap_df = await _run_sync(
-                pykrx_stock.get_market_cap, today_str, market="ALL"
-            )
-        except Exception as e:
-            logger.warning(f"시가총액 조회 실패: {e}")
-            cap_df = None
-
-        # 5) 데이터 병합 및 저장
-        synced = 0
-        pykrx_tv_map = {}   # date → 거래대금
-        if pykrx_ohlcv is not None and not pykrx_ohlcv.empty:
-            for idx, row in pykrx_ohlcv.iterrows():
-                d = idx.date() if hasattr(idx, 'date') else idx
-                tv = row.get("거래대금", None)
-                if tv is not None:
-                    pykrx_tv_map[d] = int(tv)
-
-        # 시가총액: cap_df에서 해당 종목 조회
-        latest_market_cap = None
-        latest_listed_shares = None
-        if cap_df is not None and not cap_df.empty:
-            if stock_code in cap_df.index:
-                cap_row = cap_df.loc[stock_code]
-                latest_market_cap = int(cap_row.get("시가총액", 0)) or None
-                latest_listed_shares = int(cap_row.get("상장주식수", 0)) or None
-
-        rows_to_upsert = []
-        for idx, row in ohlcv_df.iterrows():
-            trade_dt = idx.date() if hasattr(idx, 'date') else idx
-
-            # FDR 기본 데이터
-            o = int(row.get("Open", 0))
-            h = int(row.get("High", 0))
-            l = int(row.get("Low", 0))
-            c = int(row.get("Close", 0))
-            v = int(row.get("Volume", 0))
-            chg = float(row.get("Change", 0)) * 100 if "Change" in row else None
-
-            # pykrx 거래대금 매칭
-            tv = pykrx_tv_map.get(trade_dt)
-
-            if o == 0 and h == 0 and c == 0:
-                continue  # 거래 정지일 스킵
-
-            rows_to_upsert.append(dict(
-                company_id=company.id,
-                trade_date=trade_dt,
-                open=o,
-                high=h,
-                low=l,
-                close=c,
-                volume=v,
-                change_pct=round(chg, 4) if chg is not None else None,
-                trading_value=tv,
-                market_cap=latest_market_cap,       # 일별 시총은 비용이 크므로 최신값 사용
-                listed_shares=latest_listed_shares,
-            ))
-
-        # Batch upsert (50개씩)
-        batch_size = 50
-        for i in range(0, len(rows_to_upsert), batch_size):
-            batch = rows_to_upsert[i:i + batch_size]
-            stmt = pg_insert(StockPrice).values(batch)
-            stmt = stmt.on_conflict_do_update(
-                constraint="uq_stock_prices_company_date",
-                set_=dict(
-                    open=stmt.excluded.open,
-                    high=stmt.excluded.high,
-                    low=stmt.excluded.low,
-                    close=stmt.excluded.close,
-                    volume=stmt.excluded.volume,
-                    change_pct=stmt.excluded.change_pct,
-                    trading_value=stmt.excluded.trading_value,
-                    market_cap=stmt.excluded.market_cap,
-                    listed_shares=stmt.excluded.listed_shares,
-                ),
-            )
-            await self.db.execute(stmt)
-            synced += len(batch)
+        # 5) pykrx 시가총액 (전 종목 수집이면 caller가 넘겨준 map 사용)
+        if caps_map is None:
+            caps_map = await self._fetch_caps_map()
 
-        # 6) companies 테이블의 시가총액 캐시 업데이트
+        # 6) 데이터 병합 및 저장 (행 단위 루프 없이 컬럼 단위 벡터 연산)
+        tv_series = None    # 날짜 → 거래대금
+        if pykrx_ohlcv is not None and not pykrx_ohlcv.empty and "거래대금" in pykrx_ohlcv.columns:
+            tv_series = pd.Series(
+                pykrx_ohlcv["거래대금"].to_numpy(),
+                index=pd.DatetimeIndex(pykrx_ohlcv.index).normalize(),
+            )
+            # 같은 날짜가 여러 번이면 reindex가 ValueError → 마지막 값만 남김 (CLI _align_by_date와 동일)
+            tv_series = tv_series[~tv_series.index.duplicated(keep="last")]
+
+        # 시가총액: caps_map에서 해당 종목 조회
+        latest_market_cap, latest_listed_shares = caps_map.get(stock_code, (None, None))
+
+        df = ohlcv_df.rename(columns=str.lower)
+        price_cols = ["open", "high", "low", "close", "volume"]
+        prices = df.reindex(columns=price_cols).fillna(0).astype("int64")
+        trading = (prices["open"] != 0) | (prices["high"] != 0) | (prices["close"] != 0)  # 거래 정지일 스킵
+        prices = prices[trading]
+        dates = pd.DatetimeIndex(prices.index).normalize()
+
+        frame = pd.DataFrame({
+            "company_id": company.id,
+            "trade_date": dates.date,
+            **{col: prices[col].to_numpy() for col in price_cols},
+            "change_pct": (df.loc[trading, "change"] * 100).round(4).to_numpy() if "change" in df.columns else None,
+            "trading_value": tv_series.reindex(dates).astype("Int64").to_numpy() if tv_series is not None else None,
+            "market_cap": latest_market_cap,       # 일별 시총은 비용이 크므로 최신값 사용
+            "listed_shares": latest_listed_shares,
+        })
+        # numpy 스칼라/NaN → Python 값/None (asyncpg 인코딩용), 컬럼 순서 = _PRICE_COLUMNS
+        frame = frame.astype(object).where(frame.notna(), None)
+        # numeric 컬럼은 Decimal로 (행마다 컬럼명 비교 대신 컬럼 한 번에)
+        frame["change_pct"] = [None if v is None else Decimal(str(v)) for v in frame["change_pct"]]
+        records = list(frame.itertuples(index=False, name=None))
+
+        # COPY → staging → 한 번의 INSERT ... SELECT ON CONFLICT (staging 단계마다 autoflush 없이)
+        with self.db.no_autoflush:
+            synced = await self._upsert_prices(records)
+
+        # 7) companies 테이블의 시가총액 캐시 업데이트 (upsert와 같은 트랜잭션으로 한 번에 commit)
         if latest_market_cap:
             company.market_cap = latest_market_cap
             company.updated_at = datetime.utcnow()
@@ -289,10 +350,75 @@ class StockCollector:
             "stock_code": stock_code,
             "name": company.name,
             "synced": synced,
-            "has_trading_value": bool(pykrx_tv_map),
             "market_cap": latest_market_cap,
         }
 
+    async def _fetch_caps_map(self) -> dict[str, tuple]:
+        """
+        최근 거래일 전 종목 시가총액 → {종목코드: (시가총액, 상장주식수)}.
+        get_market_cap는 개별 종목 기간 조회 불가 → 일별 전 종목 조회이므로,
+        최근 거래일 시총만 가져와서 캐시. 실패 시 빈 dict.
+        """
+        try:
+            today_str = _to_pykrx_date(date.today())
+            async with _pykrx_limiter:
+                cap_df = await _run_sync(
+                    pykrx_stock.get_market_cap, today_str, market="ALL"
+                )
+        except Exception as e:
+            logger.warning(f"시가총액 조회 실패: {e}")
+            return {}
+
+        if cap_df is None or cap_df.empty:
+            return {}
+
+        return {
+            str(ticker): (int(mcap) or None, int(shares) or None)
+            for ticker, mcap, shares in zip(
+                cap_df.index, cap_df["시가총액"].fillna(0), cap_df["상장주식수"].fillna(0)
+            )
+        }
+
+    async def _fetch_last_dates(self) -> dict[int, date]:
+        """종목별 마지막 저장일 → {company_id: max(trade_date)} (GROUP BY 한 번)"""
+        result = await self.db.execute(
+            select(StockPrice.company_id, func.max(StockPrice.trade_date))
+            .group_by(StockPrice.company_id)
+        )
+        return dict(result.all())
+
+    async def _upsert_prices(self, records: list[tuple]) -> int:
+        """
+        일봉 records(_PRICE_COLUMNS 순서 tuple)를 asyncpg COPY로 임시 staging 테이블에 적재한 뒤
+        INSERT ... SELECT ... ON CONFLICT 한 번으로 stock_prices에 병합.
+        세션의 현재 트랜잭션 안에서 실행됨.
+        """
+        if not records:
+            return 0
+
+        # staging 테이블: 트랜잭션 종료 시 자동 삭제, 같은 트랜잭션 내 재호출 대비 IF NOT EXISTS
+        await self.db.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS _stage_prices ON COMMIT DROP AS "
+            f"SELECT {', '.join(_PRICE_COLUMNS)} FROM stock_prices WITH NO DATA"
+        ))
+
+        conn = await self.db.connection()
+        raw = await conn.get_raw_connection()
+        asyncpg_conn = raw.driver_connection
+
+        await asyncpg_conn.copy_records_to_table(
+            "_stage_prices", records=records, columns=_PRICE_COLUMNS
+        )
+
+        updates = ", ".join(f"{col} = EXCLUDED.{col}" for col in _PRICE_COLUMNS[2:])
+        await self.db.execute(text(
+            f"INSERT INTO stock_prices ({', '.join(_PRICE_COLUMNS)}) "
+            f"SELECT {', '.join(_PRICE_COLUMNS)} FROM _stage_prices "
+            f"ON CONFLICT ON CONSTRAINT uq_stock_prices_company_date DO UPDATE SET {updates}"
+        ))
+        await self.db.execute(text("TRUNCATE _stage_prices"))
+        return len(records)
+
     # ─── 3. 전 종목 일봉 수집 ────────────────────────────────
     async def sync_all_prices(
         self,
@@ -300,14 +426,16 @@ class StockCollector:
         end_date: Optional[str] = None,
         market: Optional[str] = None,       # KOSPI / KOSDAQ / None=전체
         limit: Optional[int] = None,        # 테스트용 제한
+        incremental: bool = True,           # False = start_date부터 전체 재수집
     ) -> dict:
         """
         전 종목 일봉 데이터 수집.
-        pykrx 호출 빈도 제한을 위해 종목 간 0.5초 sleep.
+        PRICE_SYNC_CONCURRENCY개 종목을 동시에 수집 (종목마다 별도 세션),
+        pykrx/FDR 호출 빈도는 공유 rate limiter로 제한.
         """
         log = StockSyncLog(sync_type="OHLCV", status="STARTED")
         self.db.add(log)
-        await self.db.flush()
+        await self.db.commit()  # 수집 중에도 STARTED 로그가 보이도록
 
         try:
             # 대상 종목 조회
@@ -322,24 +450,44 @@ class StockCollector:
             companies = result.scalars().all()
             log.target_count = len(companies)
 
+            # 시가총액은 전 종목 공통 → 한 번만 조회
+            caps_map = await self._fetch_caps_map()
+            # 종목별 마지막 저장일도 한 번에 (종목마다 MAX 조회 대신)
+            last_dates = await self._fetch_last_dates() if incremental else None
+            # 목록 조회 트랜잭션도 fan-out 전에 종료 → 수집 내내 outer 세션이
+            # idle in transaction으로 풀 커넥션을 잡고 있지 않도록 (expire_on_commit=False)
+            await self.db.commit()
+
             total_synced = 0
             total_errors = 0
-
-            for i, comp in enumerate(companies, 1):
-                try:
-                    result = await self.sync_prices(comp.stock_code, start_date, end_date)
-                    total_synced += result.get("synced", 0)
-
-                    if i % 50 == 0:
-                        logger.info(f"진행: {i}/{len(companies)} ({comp.stock_code} {comp.name})")
-
-                    # pykrx rate limit 방지
-                    await asyncio.sleep(0.5)
-
-                except Exception as e:
-                    total_errors += 1
-                    logger.warning(f"[{i}/{len(companies)}] {comp.stock_code} 실패: {e}")
-                    await asyncio.sleep(1)  # 에러 시 더 기다림
+            done = 0
+            sem = asyncio.Semaphore(PRICE_SYNC_CONCURRENCY)
+
+            async def _guarded(comp: Company):
+                nonlocal total_synced, total_errors, done
+                async with sem:
+                    try:
+                        # AsyncSession은 동시 사용 불가 → 종목마다 별도 세션
+                        async with self.session_factory() as db:
+                            collector = StockCollector(db, self.session_factory)
+                            # 목록 조회 때 읽은 객체를 worker 세션에 SELECT 없이 붙임
+                            # (market_cap 갱신이 이 세션의 commit으로 반영되도록)
+                            local = await db.merge(comp, load=False)
+                            result = await collector.sync_prices(
+                                comp.stock_code, start_date, end_date,
+                                company=local, caps_map=caps_map, last_dates=last_dates,
+                                incremental=incremental,
+                            )
+                        total_synced += result.get("synced", 0)
+                    except Exception as e:
+                        total_errors += 1
+                        logger.warning(f"{comp.stock_code} 실패: {e}")
+                    finally:
+                        done += 1
+                        if done % 50 == 0:
+                            logger.info(f"진행: {done}/{len(companies)}")
+
+            await asyncio.gather(*[_guarded(comp) for comp in companies])
 
             log.synced_count = total_synced
             log.error_count = total_errors
@@ -376,26 +524,22 @@ class StockCollector:
         if cap_df is None or cap_df.empty:
             return {"synced": 0, "message": "시가총액 데이터 없음"}
 
-        synced = 0
-        for ticker, row in cap_df.iterrows():
-            ticker = str(ticker).strip()
-            if len(ticker) != 6:
-                continue
-
-            mcap = int(row.get("시가총액", 0))
-            vol = int(row.get("거래량", 0))
-            tv = int(row.get("거래대금", 0))
-            listed = int(row.get("상장주식수", 0))
+        codes = cap_df.index.astype(str).str.strip()
+        valid = codes.str.len() == 6
+        codes = codes[valid]
+        caps = cap_df["시가총액"].fillna(0).astype("int64").to_numpy()[valid]
 
-            # companies 테이블의 market_cap 캐시 업데이트
-            result = await self.db.execute(
-                select(Company).where(Company.stock_code == ticker)
-            )
-            comp = result.scalar_one_or_none()
-            if comp:
-                comp.market_cap = mcap
-                comp.updated_at = datetime.utcnow()
-                synced += 1
+        # companies 테이블의 market_cap 캐시를 UPDATE ... FROM unnest 한 번으로 갱신
+        result = await self.db.execute(
+            text(
+                "UPDATE companies SET market_cap = v.mcap, updated_at = now() "
+                "FROM (SELECT unnest(CAST(:codes AS text[])) AS stock_code, "
+                "             unnest(CAST(:caps AS bigint[])) AS mcap) AS v "
+                "WHERE companies.stock_code = v.stock_code"
+            ),
+            {"codes": codes.tolist(), "caps": caps.tolist()},
+        )
+        synced = result.rowcount
 
         await self.db.commit()
         logger.info(f"시가총액 업데이트: {synced}종목")
@@ -418,6 +562,10 @@ class StockCollector:
         # 시가총액도 업데이트
         cap_result = await self.sync_market_caps(today)
 
+        # 종목 목록용 최신 시세 스냅샷 갱신 (CONCURRENTLY → 갱신 중에도 조회 가능)
+        await self.db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_latest_quote"))
+        await self.db.commit()
+
         return {
             **result,
             "market_caps_synced": cap_result.get("synced", 0),
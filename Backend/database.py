@@ -1,17 +1,38 @@
 # backend/app/database.py
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 from app.config import get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    pool_size=10,
-    max_overflow=20,
-)
+if settings.DB_USE_PGBOUNCER:
+    # PgBouncer(transaction mode)가 커넥션을 다중화 → 앱 쪽 풀은 두지 않음
+    # 트랜잭션마다 서버 커넥션이 바뀌므로 asyncpg prepared statement 캐시도 끔
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=False,
+        poolclass=NullPool,
+        connect_args={"statement_cache_size": 0, "server_settings": {"jit": "off"}},
+    )
+else:
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=False,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=30,
+        pool_pre_ping=True,      # 끊긴 커넥션(DB 재시작/idle timeout) 체크아웃 시 감지
+        pool_recycle=1800,
+        pool_use_lifo=True,      # 최근 쓴 커넥션 재사용 → 남는 커넥션은 idle로 정리되도록
+        connect_args={
+            "statement_cache_size": 2048,        # asyncpg prepared statement 캐시
+            "server_settings": {"jit": "off"},   # 짧은 OLTP 쿼리에서 JIT 컴파일 비용 제거
+        },
+    )
 
+# expire_on_commit=False: commit 후 속성 접근 시 재조회 SELECT 없음
+# autoflush는 기본값 유지 — 대량 동기화 루프만 `with db.no_autoflush:` 로 끔
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -10,18 +10,19 @@ GET  /users/{user_id}/notebooks → List user's notebooks (own + shared)
 GET  /users/{user_id}/notes    → List user's notes (with search/filter)
 """
 
+import re
 from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, or_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 from pydantic import BaseModel
 
 from app.database import get_db
 from app.config import get_settings
-from app.models.evernote import User, Notebook, Note, NoteAccess, SyncLog
+from app.models.evernote import User, Notebook, Note, NoteAccess, SyncLog, Tag
 from app.services.evernote_sync import (
     get_oauth_request_token,
     get_oauth_access_token,
@@ -31,6 +32,9 @@ from app.services.evernote_sync import (
 router = APIRouter(prefix="/evernote", tags=["evernote"])
 settings = get_settings()
 
+# Evernote token fields: "S=s432:U=4a535ee:E=154d..." → ("S", "s432"), ...
+_EN_TOKEN_RE = re.compile(r'(?:^|:)([A-Z])=([^:]*)')
+
 
 # ─── Pydantic Schemas ────────────────────────────────────────────
 
@@ -120,7 +124,7 @@ async def oauth_callback(req: OAuthCallbackRequest, db: AsyncSession = Depends(g
 
     # Parse token metadata
     # Token format: S=s432:U=4a535ee:E=154dxxxx:C=xxxx:P=xxx:A=xxx:V=2:H=xxx
-    parts = dict(p.split("=", 1) for p in token.split(":") if "=" in p)
+    parts = dict(_EN_TOKEN_RE.findall(token))
 
     user.evernote_token = token
     user.evernote_shard = parts.get("S", "")
@@ -193,32 +197,67 @@ async def sync_status(user_id: int, db: AsyncSession = Depends(get_db)):
 @router.get("/users/{user_id}/notebooks", response_model=list[NotebookOut])
 async def list_notebooks(user_id: int, db: AsyncSession = Depends(get_db)):
     """List all notebooks for a user (own + shared)."""
+    # Note counts come back with the notebooks in one GROUP BY query
     result = await db.execute(
-        select(Notebook)
+        select(Notebook, func.count(Note.id))
+        .outerjoin(Note, Note.notebook_id == Notebook.id)
         .where(Notebook.user_id == user_id)
+        .group_by(Notebook.id)
         .order_by(Notebook.is_shared, Notebook.name)
+        .options(raiseload("*"))
     )
-    notebooks = result.scalars().all()
-
-    out = []
-    for nb in notebooks:
-        # Count notes in this notebook
-        count_result = await db.execute(
-            select(func.count(Note.id)).where(Note.notebook_id == nb.id)
-        )
-        note_count = count_result.scalar() or 0
 
-        out.append(NotebookOut(
+    return [
+        NotebookOut(
             id=nb.id,
             name=nb.name,
             is_shared=nb.is_shared,
             shared_from=nb.shared_from,
-            note_count=note_count,
+            note_count=note_count or 0,
             sync_enabled=nb.sync_enabled,
             last_sync_at=nb.last_sync_at,
-        ))
+        )
+        for nb, note_count in result.all()
+    ]
+
+
+def _filter_notes(
+    stmt,
+    user_id: int,
+    q: Optional[str],
+    tag: Optional[str],
+    company: Optional[str],
+    notebook_id: Optional[int],
+    shared_only: bool,
+):
+    """Apply list_notes access check + filters (shared by the page and count queries)."""
+    # Base: notes this user has access to
+    stmt = stmt.join(NoteAccess, NoteAccess.note_id == Note.id).where(
+        and_(
+            NoteAccess.user_id == user_id,
+            Note.is_deleted == False,
+        )
+    )
+
+    if q:
+        search = f"%{q}%"
+        stmt = stmt.where(
+            (Note.title.ilike(search)) | (Note.plain_text.ilike(search))
+        )
+
+    if tag:
+        stmt = stmt.join(Note.tags).where(func.lower(Tag.name) == tag.lower())
+
+    if company:
+        stmt = stmt.where(Note.company == company)
+
+    if notebook_id:
+        stmt = stmt.where(Note.notebook_id == notebook_id)
 
-    return out
+    if shared_only:
+        stmt = stmt.join(Notebook, Note.notebook_id == Notebook.id).where(Notebook.is_shared == True)
+
+    return stmt
 
 
 @router.get("/users/{user_id}/notes", response_model=NotesListResponse)
@@ -231,50 +270,52 @@ async def list_notes(
     shared_only: bool = Query(False, description="Only show shared notes"),
     limit: int = Query(50, le=200),
     offset: int = Query(0),
+    after_created: Optional[datetime] = Query(None, description="Keyset cursor: en_created of last note seen (omit if it was null)"),
+    after_id: Optional[int] = Query(None, description="Keyset cursor: id of last note seen"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     List notes accessible by this user.
     Includes both own notes and notes shared from others (via NoteAccess).
+
+    Pagination: pass the (en_created, id) of the last note of a page as
+    after_created/after_id to get the next page without OFFSET scanning.
+    Notes without en_created sort last; if the last note had none, pass only after_id.
     """
-    # Base query: notes this user has access to
-    query = (
-        select(Note)
-        .join(NoteAccess, NoteAccess.note_id == Note.id)
-        .where(
-            and_(
-                NoteAccess.user_id == user_id,
-                Note.is_deleted == False,
-            )
-        )
-        .options(selectinload(Note.tags), selectinload(Note.notebook))
+    filters = dict(
+        user_id=user_id, q=q, tag=tag, company=company,
+        notebook_id=notebook_id, shared_only=shared_only,
     )
 
-    # Filters
-    if q:
-        search = f"%{q}%"
-        query = query.where(
-            (Note.title.ilike(search)) | (Note.plain_text.ilike(search))
-        )
-
-    if tag:
-        query = query.join(Note.tags).where(func.lower(Note.tags.property.mapper.class_.name) == tag.lower())
-
-    if company:
-        query = query.where(Note.company == company)
-
-    if notebook_id:
-        query = query.where(Note.notebook_id == notebook_id)
-
-    if shared_only:
-        query = query.join(Notebook, Note.notebook_id == Notebook.id).where(Notebook.is_shared == True)
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
+    # Count total — only the filter joins, no eager loads / ORDER BY / subquery
+    count_query = _filter_notes(
+        select(func.count(Note.id.distinct())).select_from(Note), **filters
+    )
     total = (await db.execute(count_query)).scalar() or 0
 
     # Fetch with pagination
-    query = query.order_by(Note.en_created.desc()).limit(limit).offset(offset)
+    query = (
+        _filter_notes(select(Note), **filters)
+        .options(
+            selectinload(Note.tags),
+            selectinload(Note.notebook),
+            selectinload(Note.source_user),
+            raiseload("*"),  # any other lazy load on this hot path is an N+1 bug
+        )
+        .order_by(Note.en_created.desc().nulls_last(), Note.id.desc())
+        .limit(limit)
+    )
+    if after_id is not None:
+        # Row comparison never matches NULL en_created → undated notes get their own branch
+        if after_created is not None:
+            query = query.where(or_(
+                tuple_(Note.en_created, Note.id) < (after_created, after_id),
+                Note.en_created.is_(None),
+            ))
+        else:
+            query = query.where(Note.en_created.is_(None), Note.id < after_id)
+    else:
+        query = query.offset(offset)
     result = await db.execute(query)
     notes = result.scalars().all()
 
@@ -282,7 +323,7 @@ async def list_notes(
     note_outs = []
     for note in notes:
         nb = note.notebook
-        source_user = await db.get(User, note.source_user_id)
+        source_user = note.source_user
 
         note_outs.append(NoteOut(
             id=note.id,
@@ -10,43 +10,78 @@ Handles:
 5. Deduplication by evernote_guid
 """
 
+import asyncio
+import functools
 import hashlib
 import html
 import re
 import logging
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import select, and_
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from asyncpg.exceptions import UniqueViolationError
 
-from evernote.api.client import EvernoteClient
+import evernote.edam.notestore.NoteStore as NoteStore
+from evernote.api.client import EvernoteClient, Store
 from evernote.edam.notestore.ttypes import NoteFilter, NotesMetadataResultSpec
 from evernote.edam.type.ttypes import Note as ENNote
 
 from app.config import get_settings
+from app.database import async_session
 from app.models.evernote import User, Notebook, Note, Tag, NoteTag, NoteAccess, SyncLog
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Max notebooks whose notes are synced concurrently in full_sync_user
+NOTEBOOK_SYNC_CONCURRENCY = 8
+# Max findNotesMetadata pages in flight per own notebook (Evernote rate-limits per token)
+NOTE_PAGE_CONCURRENCY = 4
+
 
 # ─── ENML → Plain Text ─────────────────────────────────────────
+# CDATA markers + any tag (covers <en-note>, </en-note>, <en-media/>) in one pass
+_ENML_STRIP = re.compile(r'<!\[CDATA\[|\]\]>|<[^>]+>')
+
+
 def strip_enml(enml_content: str) -> str:
     """Strip ENML/HTML tags to get plain text for search & AI."""
     if not enml_content:
         return ""
-    text = re.sub(r'<!\[CDATA\[', '', enml_content)
-    text = re.sub(r'\]\]>', '', text)
-    text = re.sub(r'<en-note[^>]*>', '', text)
-    text = re.sub(r'</en-note>', '', text)
-    text = re.sub(r'<en-media[^>]*/>', '', text)  # remove embedded resources
-    text = re.sub(r'<[^>]+>', '', text)            # strip remaining HTML
+    text = _ENML_STRIP.sub('', enml_content)
     text = html.unescape(text)
     return text.strip()
 
 
+def content_hash(content: Optional[str]) -> str:
+    """Change-detection hash of note content (32 hex chars, fits notes.content_hash)."""
+    return hashlib.blake2b((content or "").encode(), digest_size=16).hexdigest()
+
+
+# content_hash → plain text. A note shared to several users is synced once
+# per user; this keeps the same ENML from being stripped again each time.
+_PLAIN_TEXT_CACHE_SIZE = 1024
+_plain_text_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _plain_text(enml_content: Optional[str], digest: str) -> str:
+    """strip_enml() memoized on the content hash (bounded LRU)."""
+    text = _plain_text_cache.get(digest)
+    if text is not None:
+        _plain_text_cache.move_to_end(digest)
+        return text
+
+    text = strip_enml(enml_content)
+    _plain_text_cache[digest] = text
+    if len(_plain_text_cache) > _PLAIN_TEXT_CACHE_SIZE:
+        _plain_text_cache.popitem(last=False)
+    return text
+
+
 def en_timestamp_to_datetime(ts: Optional[int]) -> Optional[datetime]:
     """Convert Evernote timestamp (ms since epoch) to datetime."""
     if not ts:
@@ -55,15 +90,41 @@ def en_timestamp_to_datetime(ts: Optional[int]) -> Optional[datetime]:
 
 
 # ─── OAuth Helper ───────────────────────────────────────────────
+# Bound once at import; settings are fixed for the process lifetime
+_CONSUMER_KEY = settings.EVERNOTE_CONSUMER_KEY
+_CONSUMER_SECRET = settings.EVERNOTE_CONSUMER_SECRET
+_SANDBOX = settings.EVERNOTE_SANDBOX
+
+
 def get_evernote_client(token: str = None) -> EvernoteClient:
     return EvernoteClient(
-        consumer_key=settings.EVERNOTE_CONSUMER_KEY,
-        consumer_secret=settings.EVERNOTE_CONSUMER_SECRET,
-        sandbox=settings.EVERNOTE_SANDBOX,
+        consumer_key=_CONSUMER_KEY,
+        consumer_secret=_CONSUMER_SECRET,
+        sandbox=_SANDBOX,
         token=token,
     )
 
 
+async def _rpc(fn, *args, **kwargs):
+    """
+    Run a blocking Evernote SDK (Thrift) call in the default executor so it
+    doesn't stall the event loop. A given note store must still only have
+    one call in flight — await each call before issuing the next.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
+
+def _note_store_url(client: EvernoteClient) -> str:
+    """The user's note store URL (the getNoteStoreUrl round trip inside get_note_store)."""
+    return client.get_user_store().getNoteStoreUrl()
+
+
+def _note_store_at(token: str, note_store_url: str):
+    """Note store client for an already-resolved URL — no Evernote round trip."""
+    return Store(token, NoteStore.Client, note_store_url)
+
+
 def get_oauth_request_token(callback_url: str) -> dict:
     """Step 1: Get request token for OAuth flow."""
     client = get_evernote_client()
@@ -91,42 +152,49 @@ def get_oauth_access_token(
 
 
 # ─── Sync: Own Notebooks ───────────────────────────────────────
+async def _upsert_notebooks(db: AsyncSession, values: list[dict], update_cols: list[str]) -> list[Notebook]:
+    """
+    Upsert all notebook rows in one INSERT ... ON CONFLICT ... RETURNING
+    and hand back the resulting Notebook ORM objects.
+    """
+    if not values:
+        return []
+
+    stmt = pg_insert(Notebook).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "notebook_guid"],
+        set_={
+            **{col: stmt.excluded[col] for col in update_cols},
+            "updated_at": datetime.utcnow(),
+        },
+    ).returning(Notebook)
+
+    result = await db.scalars(stmt, execution_options={"populate_existing": True})
+    return list(result.all())
+
+
 async def sync_own_notebooks(db: AsyncSession, user: User) -> list[Notebook]:
     """Sync user's own notebooks from Evernote."""
     client = get_evernote_client(token=user.evernote_token)
-    note_store = client.get_note_store()
-
-    en_notebooks = note_store.listNotebooks()
-    synced = []
-
-    for nb in en_notebooks:
-        # Upsert notebook
-        stmt = pg_insert(Notebook.__table__).values(
-            user_id=user.id,
-            notebook_guid=nb.guid,
-            name=nb.name,
-            stack=nb.stack,
-            is_shared=False,
-            usn=nb.updateSequenceNum or 0,
-        ).on_conflict_do_update(
-            index_elements=["user_id", "notebook_guid"],
-            set_={
-                "name": nb.name,
-                "stack": nb.stack,
-                "usn": nb.updateSequenceNum or 0,
-                "updated_at": datetime.utcnow(),
-            },
-        )
-        await db.execute(stmt)
-
-        # Get or create the Notebook ORM object
-        result = await db.execute(
-            select(Notebook).where(
-                and_(Notebook.user_id == user.id, Notebook.notebook_guid == nb.guid)
+    note_store = await _rpc(client.get_note_store)
+
+    en_notebooks = await _rpc(note_store.listNotebooks)
+
+    synced = await _upsert_notebooks(
+        db,
+        [
+            dict(
+                user_id=user.id,
+                notebook_guid=nb.guid,
+                name=nb.name,
+                stack=nb.stack,
+                is_shared=False,
+                usn=nb.updateSequenceNum or 0,
             )
-        )
-        notebook = result.scalar_one()
-        synced.append(notebook)
+            for nb in en_notebooks
+        ],
+        update_cols=["name", "stack", "usn"],
+    )
 
     await db.commit()
     logger.info(f"[{user.name}] Synced {len(synced)} own notebooks")
@@ -137,64 +205,61 @@ async def sync_own_notebooks(db: AsyncSession, user: User) -> list[Notebook]:
 async def sync_linked_notebooks(db: AsyncSession, user: User) -> list[Notebook]:
     """Sync notebooks shared TO this user from other Evernote users."""
     client = get_evernote_client(token=user.evernote_token)
-    note_store = client.get_note_store()
+    note_store = await _rpc(client.get_note_store)
 
-    linked_notebooks = note_store.listLinkedNotebooks()
-    synced = []
+    linked_notebooks = await _rpc(note_store.listLinkedNotebooks)
 
+    # notebook_guid → (row values, shared note store); keyed so a notebook
+    # linked twice doesn't hit the same row twice in one ON CONFLICT
+    linked = {}
     for lnb in linked_notebooks:
         # Get shared notebook store & auth token
-        shared_note_store = client.getSharedNoteStore(lnb)
-        shared_nb = shared_note_store.getSharedNotebookByAuth()
+        shared_note_store = await _rpc(client.getSharedNoteStore, lnb)
+        shared_nb = await _rpc(shared_note_store.getSharedNotebookByAuth)
 
         # Determine owner name
         shared_from = lnb.username or lnb.shareName or "Unknown"
 
-        stmt = pg_insert(Notebook.__table__).values(
-            user_id=user.id,
-            notebook_guid=shared_nb.notebookGuid,
-            name=lnb.shareName or "Shared Notebook",
-            is_shared=True,
-            shared_from=shared_from,
-            shared_notebook_guid=str(shared_nb.id) if shared_nb.id else None,
-            privilege=_map_privilege(shared_nb.privilege),
-        ).on_conflict_do_update(
-            index_elements=["user_id", "notebook_guid"],
-            set_={
-                "name": lnb.shareName or "Shared Notebook",
-                "shared_from": shared_from,
-                "updated_at": datetime.utcnow(),
-            },
+        linked[shared_nb.notebookGuid] = (
+            dict(
+                user_id=user.id,
+                notebook_guid=shared_nb.notebookGuid,
+                name=lnb.shareName or "Shared Notebook",
+                is_shared=True,
+                shared_from=shared_from,
+                shared_notebook_guid=str(shared_nb.id) if shared_nb.id else None,
+                privilege=_map_privilege(shared_nb.privilege),
+            ),
+            shared_note_store,
         )
-        await db.execute(stmt)
 
-        result = await db.execute(
-            select(Notebook).where(
-                and_(
-                    Notebook.user_id == user.id,
-                    Notebook.notebook_guid == shared_nb.notebookGuid,
-                )
-            )
-        )
-        notebook = result.scalar_one()
+    synced = await _upsert_notebooks(
+        db,
+        [values for values, _ in linked.values()],
+        update_cols=["name", "shared_from"],
+    )
+
+    for notebook in synced:
         # Store the shared note store reference for note sync
-        notebook._shared_note_store = shared_note_store
-        notebook._shared_nb_guid = shared_nb.notebookGuid
-        synced.append(notebook)
+        notebook._shared_note_store = linked[notebook.notebook_guid][1]
+        notebook._shared_nb_guid = notebook.notebook_guid
 
     await db.commit()
     logger.info(f"[{user.name}] Synced {len(synced)} linked notebooks")
     return synced
 
 
+# Evernote SharedNotebookPrivilegeLevel → notebooks.privilege
+_PRIVILEGE_MAP = {
+    1: "READ",
+    2: "MODIFY",
+    3: "FULL",
+}
+
+
 def _map_privilege(priv) -> str:
     """Map Evernote SharedNotebookPrivilegeLevel to string."""
-    mapping = {
-        1: "READ",
-        2: "MODIFY",
-        3: "FULL",
-    }
-    return mapping.get(priv, "READ")
+    return _PRIVILEGE_MAP.get(priv, "READ")
 
 
 # ─── Sync: Notes in a Notebook ──────────────────────────────────
@@ -204,22 +269,32 @@ async def sync_notes_in_notebook(
     notebook: Notebook,
     note_store=None,
     full_sync: bool = False,
+    note_store_url: Optional[str] = None,
 ) -> int:
     """
     Sync all notes in a given notebook.
     Handles deduplication: if another user already synced the same note (same GUID),
     we just add a NoteAccess record instead of duplicating.
+    `note_store_url` is the user's own note store URL, if the caller already resolved it.
     """
     if not notebook.sync_enabled:
         return 0
 
-    if note_store is None:
-        client = get_evernote_client(token=user.evernote_token)
-        # For linked notebooks, use the shared note store
-        if notebook.is_shared and hasattr(notebook, '_shared_note_store'):
-            note_store = notebook._shared_note_store
-        else:
-            note_store = client.get_note_store()
+    # Thrift stores aren't thread-safe, so concurrent page fetches each need
+    # their own. Own-notebook stores are built from the note store URL (resolved
+    # at most once); shared ones cost an auth round trip, so those pages are
+    # fetched one after another.
+    if note_store is not None:
+        note_store_url = None
+    # For linked notebooks, use the shared note store
+    elif notebook.is_shared and hasattr(notebook, '_shared_note_store'):
+        note_store = notebook._shared_note_store
+        note_store_url = None
+    else:
+        if note_store_url is None:
+            client = get_evernote_client(token=user.evernote_token)
+            note_store_url = await _rpc(_note_store_url, client)
+        note_store = await _rpc(_note_store_at, user.evernote_token, note_store_url)
 
     # Set up note filter
     note_filter = NoteFilter()
@@ -236,30 +311,71 @@ async def sync_notes_in_notebook(
         includeContentLength=True,
         includeNotebookGuid=True,
         includeTagGuids=True,
+        includeUpdateSequenceNum=True,
     )
 
-    offset = 0
     batch_size = 50
     total_synced = 0
 
-    while True:
-        notes_metadata = note_store.findNotesMetadata(
-            note_filter, offset, batch_size, result_spec
-        )
+    def _fetch_page(store, offset: int):
+        return _rpc(store.findNotesMetadata, note_filter, offset, batch_size, result_spec)
 
+    # Page 1 tells us totalNotes; the remaining pages are independent calls
+    pages = [await _fetch_page(note_store, 0)]
+    offsets = range(batch_size, pages[0].totalNotes or 0, batch_size)
+    if note_store_url is not None and len(offsets) > 1:
+        page_sem = asyncio.Semaphore(NOTE_PAGE_CONCURRENCY)
+
+        async def _fetch_own_page(offset: int):
+            async with page_sem:
+                store = await _rpc(_note_store_at, user.evernote_token, note_store_url)
+                return await _fetch_page(store, offset)
+
+        pages += await asyncio.gather(*[_fetch_own_page(off) for off in offsets])
+    else:
+        for off in offsets:
+            pages.append(await _fetch_page(note_store, off))
+
+    for notes_metadata in pages:
         if not notes_metadata.notes:
-            break
+            continue
 
-        for meta in notes_metadata.notes:
-            synced = await _sync_single_note(
-                db, user, notebook, note_store, meta
-            )
-            if synced:
-                total_synced += 1
+        # One IN query for the whole page instead of a SELECT per note
+        guids = [meta.guid for meta in notes_metadata.notes]
+        result = await db.execute(select(Note).where(Note.evernote_guid.in_(guids)))
+        existing_map = {n.evernote_guid: n for n in result.scalars()}
+
+        metas = notes_metadata.notes
+        if full_sync:
+            # Import notes nobody has synced yet via COPY instead of per-row INSERTs
+            new_metas = [meta for meta in metas if meta.guid not in existing_map]
+            try:
+                # Savepoint: a failed COPY rolls back only itself, not the rest of the page
+                async with db.begin_nested():
+                    total_synced += await _copy_new_notes(db, user, notebook, note_store, new_metas)
+                metas = [meta for meta in metas if meta.guid in existing_map]
+            except UniqueViolationError:
+                # Another user's sync inserted one of these shared notes after the
+                # prefetch (COPY has no ON CONFLICT) → upsert this page note by note
+                logger.info(f"[{user.name}] COPY conflict in '{notebook.name}', falling back to per-note sync")
+                result = await db.execute(
+                    select(Note).where(Note.evernote_guid.in_([meta.guid for meta in new_metas]))
+                )
+                existing_map.update((n.evernote_guid, n) for n in result.scalars())
+
+        # Updated notes are flushed by the page commit, not before every statement
+        # (new notes flush explicitly for their id)
+        with db.no_autoflush:
+            for meta in metas:
+                synced = await _sync_single_note(
+                    db, user, notebook, note_store, meta,
+                    existing=existing_map.get(meta.guid),
+                )
+                if synced:
+                    total_synced += 1
 
-        offset += batch_size
-        if offset >= notes_metadata.totalNotes:
-            break
+        # One transaction per metadata page rather than per note
+        await db.commit()
 
     # Update notebook sync time
     notebook.last_sync_at = datetime.utcnow()
@@ -275,9 +391,12 @@ async def _sync_single_note(
     notebook: Notebook,
     note_store,
     meta,
+    existing: Optional[Note] = None,
 ) -> bool:
     """
     Sync a single note. Returns True if new/updated.
+    Does not commit — the caller commits once per metadata page.
+    `existing` is the already-synced Note row for meta.guid (prefetched per page), if any.
 
     Dedup logic:
     - If evernote_guid already exists → check content_hash
@@ -287,21 +406,18 @@ async def _sync_single_note(
     """
     guid = meta.guid
 
-    # Check if note already exists in DB
-    result = await db.execute(
-        select(Note).where(Note.evernote_guid == guid)
-    )
-    existing = result.scalar_one_or_none()
-
     if existing:
         # Note already synced by someone — just add access
         await _ensure_note_access(db, existing.id, user.id)
 
+        # Unchanged USN → nothing moved since last sync, skip getNote entirely
+        if meta.updateSequenceNum is not None and existing.usn == meta.updateSequenceNum:
+            return False
+
         # Check if content changed (compare content hash)
-        en_note = note_store.getNote(guid, True, False, False, False)
-        new_hash = hashlib.md5(
-            (en_note.content or "").encode()
-        ).hexdigest()
+        en_note = await _rpc(note_store.getNote, guid, True, False, False, False)
+        new_hash = content_hash(en_note.content)
+        existing.usn = en_note.updateSequenceNum
 
         if existing.content_hash == new_hash:
             return False  # No changes
@@ -309,20 +425,19 @@ async def _sync_single_note(
         # Content updated — refresh
         existing.title = en_note.title or existing.title
         existing.enml_content = en_note.content
-        existing.plain_text = strip_enml(en_note.content)
+        existing.plain_text = _plain_text(en_note.content, new_hash)
         existing.content_hash = new_hash
         existing.content_length = en_note.contentLength or 0
         existing.en_updated = en_timestamp_to_datetime(en_note.updated)
         existing.updated_at = datetime.utcnow()
 
         await _sync_note_tags(db, existing.id, note_store, en_note.tagGuids)
-        await db.commit()
         return True
 
     # New note — fetch full content
-    en_note = note_store.getNote(guid, True, False, False, False)
-    content_hash = hashlib.md5((en_note.content or "").encode()).hexdigest()
-    plain_text = strip_enml(en_note.content)
+    en_note = await _rpc(note_store.getNote, guid, True, False, False, False)
+    new_hash = content_hash(en_note.content)
+    plain_text = _plain_text(en_note.content, new_hash)
 
     note = Note(
         evernote_guid=guid,
@@ -331,7 +446,8 @@ async def _sync_single_note(
         title=en_note.title or "Untitled",
         plain_text=plain_text,
         enml_content=en_note.content,
-        content_hash=content_hash,
+        content_hash=new_hash,
+        usn=en_note.updateSequenceNum,
         content_length=en_note.contentLength or 0,
         source_url=en_note.attributes.sourceURL if en_note.attributes else None,
         author=en_note.attributes.author if en_note.attributes else None,
@@ -346,11 +462,94 @@ async def _sync_single_note(
 
     # Tags
     await _sync_note_tags(db, note.id, note_store, en_note.tagGuids)
-
-    await db.commit()
     return True
 
 
+# Columns filled by _copy_new_notes; the rest take their server defaults
+_NOTE_COPY_COLUMNS = [
+    "evernote_guid", "notebook_id", "source_user_id", "title", "plain_text",
+    "enml_content", "content_hash", "content_length", "usn", "source_url",
+    "author", "en_created", "en_updated",
+]
+
+
+async def _copy_new_notes(
+    db: AsyncSession,
+    user: User,
+    notebook: Notebook,
+    note_store,
+    metas: list,
+) -> int:
+    """
+    Bulk-import notes that don't exist in the DB yet using asyncpg COPY
+    (notes → note_access → note_tags). Runs inside the session's transaction.
+    Returns the number of notes imported.
+    """
+    if not metas:
+        return 0
+
+    en_notes = [
+        await _rpc(note_store.getNote, meta.guid, True, False, False, False)
+        for meta in metas
+    ]
+    note_records = []
+    for en_note in en_notes:
+        digest = content_hash(en_note.content)
+        note_records.append((
+            en_note.guid,
+            notebook.id,
+            user.id,
+            en_note.title or "Untitled",
+            _plain_text(en_note.content, digest),
+            en_note.content,
+            digest,
+            en_note.contentLength or 0,
+            en_note.updateSequenceNum,
+            en_note.attributes.sourceURL if en_note.attributes else None,
+            en_note.attributes.author if en_note.attributes else None,
+            en_timestamp_to_datetime(en_note.created),
+            en_timestamp_to_datetime(en_note.updated),
+        ))
+
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    asyncpg_conn = raw.driver_connection
+
+    await asyncpg_conn.copy_records_to_table(
+        "notes", records=note_records, columns=_NOTE_COPY_COLUMNS
+    )
+
+    # COPY has no RETURNING → read the new ids back in one query
+    result = await db.execute(
+        select(Note.evernote_guid, Note.id).where(
+            Note.evernote_guid.in_([en_note.guid for en_note in en_notes])
+        )
+    )
+    note_ids = dict(result.all())
+
+    synced_at = datetime.utcnow()
+    await asyncpg_conn.copy_records_to_table(
+        "note_access",
+        records=[(note_ids[n.guid], user.id, "SYNC", synced_at) for n in en_notes],
+        columns=["note_id", "user_id", "access_type", "synced_at"],
+    )
+
+    all_tag_guids = [tguid for n in en_notes for tguid in (n.tagGuids or [])]
+    tag_ids = await _resolve_tag_ids(db, note_store, all_tag_guids)
+    tag_records = [
+        (note_ids[n.guid], tag_ids[tguid])
+        for n in en_notes
+        for tguid in dict.fromkeys(n.tagGuids or [])
+        if tguid in tag_ids
+    ]
+    if tag_records:
+        await asyncpg_conn.copy_records_to_table(
+            "note_tags", records=tag_records, columns=["note_id", "tag_id"]
+        )
+
+    return len(en_notes)
+
+
 async def _ensure_note_access(db: AsyncSession, note_id: int, user_id: int):
     """Add user→note access record if not exists."""
     stmt = pg_insert(NoteAccess.__table__).values(
@@ -369,29 +568,57 @@ async def _sync_note_tags(
     if not tag_guids:
         return
 
-    for tguid in tag_guids:
-        # Get or create tag
-        result = await db.execute(
-            select(Tag).where(Tag.evernote_guid == tguid)
-        )
-        tag = result.scalar_one_or_none()
+    tag_ids = await _resolve_tag_ids(db, note_store, tag_guids)
 
-        if not tag:
-            try:
-                en_tag = note_store.getTag(tguid)
-                tag = Tag(evernote_guid=tguid, name=en_tag.name)
-                db.add(tag)
-                await db.flush()
-            except Exception:
-                continue
-
-        # Link note ↔ tag
-        stmt = pg_insert(NoteTag.__table__).values(
-            note_id=note_id, tag_id=tag.id
-        ).on_conflict_do_nothing()
+    # Link note ↔ tags
+    links = [
+        {"note_id": note_id, "tag_id": tag_ids[tguid]}
+        for tguid in dict.fromkeys(tag_guids)
+        if tguid in tag_ids
+    ]
+    if links:
+        stmt = pg_insert(NoteTag.__table__).values(links).on_conflict_do_nothing()
         await db.execute(stmt)
 
 
+async def _resolve_tag_ids(db: AsyncSession, note_store, tag_guids: list) -> dict:
+    """Map Evernote tag GUIDs → tags.id, creating missing tags. GUIDs that can't be fetched are left out."""
+    if not tag_guids:
+        return {}
+
+    # Known tags: one IN query
+    result = await db.execute(
+        select(Tag.evernote_guid, Tag.id).where(Tag.evernote_guid.in_(tag_guids))
+    )
+    tag_ids = dict(result.all())
+
+    # Unknown tags: fetch names from Evernote, then insert them in one statement
+    new_tags = {}
+    for tguid in tag_guids:
+        if tguid in tag_ids or tguid in new_tags:
+            continue
+        try:
+            en_tag = await _rpc(note_store.getTag, tguid)
+        except Exception:
+            continue
+        new_tags[tguid] = {"evernote_guid": tguid, "name": en_tag.name}
+
+    if new_tags:
+        tags = Tag.__table__
+        # Notebooks sync concurrently: insert in GUID order so two transactions
+        # upserting overlapping tags take the row locks in the same order
+        stmt = pg_insert(tags).values([new_tags[tguid] for tguid in sorted(new_tags)])
+        # DO UPDATE rather than DO NOTHING so rows inserted concurrently are still returned
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["evernote_guid"],
+            set_={"name": stmt.excluded.name},
+        ).returning(tags.c.evernote_guid, tags.c.id)
+        result = await db.execute(stmt)
+        tag_ids.update(result.all())
+
+    return tag_ids
+
+
 # ─── Full Sync Orchestrator ─────────────────────────────────────
 async def full_sync_user(db: AsyncSession, user: User) -> dict:
     """
@@ -418,15 +645,35 @@ async def full_sync_user(db: AsyncSession, user: User) -> dict:
         # 2. Linked notebooks
         linked_notebooks = await sync_linked_notebooks(db, user)
 
-        # 3. Sync notes
-        total_notes = 0
+        # 3. Sync notes (notebooks in parallel)
         all_notebooks = own_notebooks + linked_notebooks
-
-        for notebook in all_notebooks:
-            count = await sync_notes_in_notebook(
-                db, user, notebook, full_sync=True
-            )
-            total_notes += count
+        sem = asyncio.Semaphore(NOTEBOOK_SYNC_CONCURRENCY)
+
+        # One getNoteStoreUrl for all own notebooks instead of one per task
+        note_store_url = None
+        if own_notebooks:
+            client = get_evernote_client(token=user.evernote_token)
+            note_store_url = await _rpc(_note_store_url, client)
+
+        async def _bounded(notebook: Notebook) -> int:
+            async with sem:
+                # AsyncSession isn't safe for concurrent use → one session per notebook
+                async with async_session() as nb_db:
+                    nb = await nb_db.merge(notebook, load=False)
+                    return await sync_notes_in_notebook(
+                        nb_db, user, nb,
+                        note_store=getattr(notebook, "_shared_note_store", None),
+                        full_sync=True,
+                        note_store_url=note_store_url,
+                    )
+
+        counts = await asyncio.gather(
+            *[_bounded(nb) for nb in all_notebooks], return_exceptions=True
+        )
+        for count in counts:
+            if isinstance(count, BaseException):
+                raise count
+        total_notes = sum(counts)
 
         # Update user last_sync
         user.last_sync_at = datetime.utcnow()
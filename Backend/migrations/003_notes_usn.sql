@@ -0,0 +1,8 @@
+-- ============================================================
+-- 003: notes.usn (증분 동기화용 Update Sequence Number)
+-- Run after 002_stock_prices_extend.sql
+-- ============================================================
+
+-- USN이 같으면 getNote 호출 없이 스킵
+ALTER TABLE notes
+    ADD COLUMN IF NOT EXISTS usn             INT;             -- Evernote updateSequenceNum
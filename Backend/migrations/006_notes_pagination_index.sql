@@ -0,0 +1,12 @@
+-- ============================================================
+-- 006: list_notes 정렬/페이지네이션 인덱스
+-- Run after 003_notes_usn.sql
+-- ============================================================
+
+-- ORDER BY en_created DESC NULLS LAST, id DESC + keyset (en_created, id) < (:c, :id)
+-- 인덱스 순서를 정렬과 똑같이 (en_created 없는 노트는 맨 뒤)
+CREATE INDEX IF NOT EXISTS idx_notes_created_id_desc ON notes (en_created DESC NULLS LAST, id DESC);
+DROP INDEX IF EXISTS idx_notes_created;     -- 위 인덱스의 prefix와 중복
+
+-- note_access PK는 (note_id, user_id) → user_id 선행 인덱스 추가
+CREATE INDEX IF NOT EXISTS idx_note_access_user_note ON note_access (user_id, note_id);
@@ -0,0 +1,25 @@
+-- ============================================================
+-- 007: 기간 조회용 커버링 인덱스 + 활성 종목 시장별 partial index
+-- Run after 006_notes_pagination_index.sql
+--
+-- CONCURRENTLY는 트랜잭션 블록 안에서 실행 불가 → psql에서 autocommit으로 실행
+--   psql -f migrations/007_price_range_covering_index.sql
+-- 확인: EXPLAIN (ANALYZE, BUFFERS) → "Index Only Scan using ix_stock_prices_company_date_covering"
+-- ============================================================
+
+-- get_prices / 보조지표 / 최근 N일 차트: WHERE company_id = ? [AND trade_date BETWEEN ? AND ?]
+-- (company_id, trade_date DESC) + OHLCV 등 INCLUDE → heap fetch 없는 index-only scan
+-- stock_prices 커버링 인덱스는 여기서 한 번만 생성 (CONCURRENTLY → 생성 중에도 쓰기 가능)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_stock_prices_company_date_covering
+    ON stock_prices (company_id, trade_date DESC)
+    INCLUDE (open, high, low, close, volume, trading_value, market_cap, change_pct);
+
+-- 위 인덱스와 키가 같은 기존 인덱스 제거
+-- (idx_stock_prices_lookup: ORM 모델의 (company_id, trade_date), idx_stock_prices_date: 001)
+DROP INDEX CONCURRENTLY IF EXISTS idx_stock_prices_lookup;
+DROP INDEX CONCURRENTLY IF EXISTS idx_stock_prices_date;
+
+-- list_companies: WHERE is_active AND market = ? ORDER BY stock_code
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_companies_active_market
+    ON companies (market, stock_code)
+    WHERE is_active = TRUE;
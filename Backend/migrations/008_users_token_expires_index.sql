@@ -0,0 +1,10 @@
+-- ============================================================
+-- 008: Evernote 연결 사용자 조회용 partial index
+-- Run after 007_price_range_covering_index.sql
+-- ============================================================
+
+-- User.is_evernote_connected (hybrid) SQL 식:
+--   evernote_token IS NOT NULL AND token_expires_at > now()
+CREATE INDEX IF NOT EXISTS ix_users_token_expires
+    ON users (token_expires_at)
+    WHERE evernote_token IS NOT NULL;
@@ -0,0 +1,16 @@
+-- ============================================================
+-- 009: 종목 검색용 trigram / prefix 인덱스
+-- Run after 008_users_token_expires_index.sql
+-- ============================================================
+
+-- list_companies(search=...) 의 ILIKE '%q%' 를 seq scan 대신 GIN 인덱스로
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_companies_name_trgm
+    ON companies USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_companies_code_trgm
+    ON companies USING gin (stock_code gin_trgm_ops);
+
+-- 숫자만 입력한 경우 stock_code LIKE 'q%' (text_pattern_ops → 비-C collation에서도 btree 사용)
+CREATE INDEX IF NOT EXISTS ix_companies_code_prefix
+    ON companies (stock_code text_pattern_ops);
@@ -0,0 +1,20 @@
+-- ============================================================
+-- 010: 종목별 최신 일봉 스냅샷 materialized view
+-- Run after 009_companies_search_trgm.sql
+-- ============================================================
+
+-- list_companies가 종가/등락률/거래량을 함께 반환하도록 (종목마다 /prices 조회 대체)
+-- ix_stock_prices_company_date_covering (company_id, trade_date DESC) 으로 생성
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_latest_quote AS
+SELECT DISTINCT ON (company_id)
+    company_id, trade_date, close, volume, change_pct, market_cap
+FROM stock_prices
+ORDER BY company_id, trade_date DESC
+WITH DATA;
+
+-- REFRESH ... CONCURRENTLY 에 unique index 필요
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_latest_quote_company
+    ON mv_latest_quote (company_id);
+
+-- 갱신: StockCollector.sync_today() 마지막 단계
+--   REFRESH MATERIALIZED VIEW CONCURRENTLY mv_latest_quote;
@@ -1,15 +1,23 @@
 # backend/app/models/evernote.py
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy import (
     Column, Integer, BigInteger, String, Text, Boolean,
-    DateTime, ForeignKey, UniqueConstraint
+    DateTime, ForeignKey, UniqueConstraint, Index, and_, func, text
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from app.database import Base
 
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # "connected users" filter (is_evernote_connected in SQL)
+        Index(
+            "ix_users_token_expires", "token_expires_at",
+            postgresql_where=text("evernote_token IS NOT NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     email = Column(String(255), unique=True, nullable=False)
@@ -29,9 +37,18 @@ class User(Base):
     notebooks = relationship("Notebook", back_populates="user", cascade="all, delete-orphan")
     notes = relationship("Note", back_populates="source_user", foreign_keys="Note.source_user_id")
 
-    @property
+    @hybrid_property
     def is_evernote_connected(self) -> bool:
-        return bool(self.evernote_token and self.token_expires_at and self.token_expires_at > datetime.utcnow())
+        return bool(
+            self.evernote_token
+            and self.token_expires_at
+            and self.token_expires_at > datetime.now(timezone.utc)
+        )
+
+    @is_evernote_connected.expression
+    def is_evernote_connected(cls):
+        # e.g. select(User).where(User.is_evernote_connected) — evaluated in Postgres
+        return and_(cls.evernote_token.isnot(None), cls.token_expires_at > func.now())
 
     def __repr__(self):
         return f"<User {self.name} ({self.email})>"
@@ -73,6 +90,10 @@ class Notebook(Base):
 
 class Note(Base):
     __tablename__ = "notes"
+    __table_args__ = (
+        # list_notes pagination (ORDER BY en_created DESC NULLS LAST, id DESC)
+        Index("idx_notes_created_id_desc", text("en_created DESC NULLS LAST"), text("id DESC")),
+    )
 
     id = Column(Integer, primary_key=True)
 
@@ -85,6 +106,7 @@ class Note(Base):
     enml_content = Column(Text)
     content_hash = Column(String(32))
     content_length = Column(Integer, default=0)
+    usn = Column(Integer)  # Evernote updateSequenceNum at last sync
 
     source_url = Column(Text)
     author = Column(String(255))
@@ -130,6 +152,10 @@ class NoteTag(Base):
 
 class NoteAccess(Base):
     __tablename__ = "note_access"
+    __table_args__ = (
+        # PK is (note_id, user_id); list_notes filters by user first
+        Index("idx_note_access_user_note", "user_id", "note_id"),
+    )
 
     note_id = Column(Integer, ForeignKey("notes.id", ondelete="CASCADE"), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# backend/scripts/_build_indicators.py
+"""
+_indicators.py의 njit 커널을 numba.pycc로 AOT 컴파일 → scripts/stock_indicators_native.*.so
+
+collect_stock_data.py는 이 모듈이 있으면 JIT 워밍업 없이 바로 사용하고,
+없으면 _indicators의 njit(cache=True) 커널(또는 순수 Python)로 fallback.
+pycc로 export한 함수는 GIL을 잡고 실행 → AOT 사용 시 cmd_indicators는 지표를 순서대로 계산.
+
+사용법 (numba 필요, 빌드 환경과 같은 Python/numpy 버전에서 실행):
+    python scripts/_build_indicators.py
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+import _indicators as k
+
+cc = CC("stock_indicators_native")
+cc.output_dir = str(Path(__file__).resolve().parent)
+cc.verbose = True
+
+# (커널, 시그니처) — 정수 인자는 i8, 가격/거래량 배열은 f8[:]
+_EXPORTS = [
+    (k._rolling_mean_loop, "f8[:](f8[:], i8)"),
+    (k._ema, "f8[:](f8[:], i8)"),
+    (k._rsi_loop, "f8[:](f8[:], i8)"),
+    (k._macd_loop, "UniTuple(f8[:], 3)(f8[:], i8, i8, i8)"),
+    (k._bb_loop, "UniTuple(f8[:], 3)(f8[:], i8, f8)"),
+    (k._obv_loop, "f8[:](f8[:], f8[:])"),
+    (k._stoch_loop, "UniTuple(f8[:], 2)(f8[:], f8[:], f8[:], i8, i8, i8)"),
+    (k._atr_loop, "f8[:](f8[:], f8[:], f8[:], i8)"),
+    (k._cci_loop, "f8[:](f8[:], f8[:], f8[:], i8)"),
+]
+
+for kernel, signature in _EXPORTS:
+    # njit 디스패처가 아니라 원본 Python 함수를 넘김 (내부에서 부르는 njit 헬퍼는 numba가 해석)
+    cc.export(kernel.py_func.__name__, signature)(kernel.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
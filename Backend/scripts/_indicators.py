@@ -0,0 +1,250 @@
+# backend/scripts/_indicators.py
+"""
+TA-Lib 미설치 시 사용하는 보조지표 fallback 커널.
+
+- 입력/출력 모두 np.float64 1차원 배열, 값이 없는 구간은 NaN
+- 커널은 미리 할당한 배열 위의 단순 for 루프 → numba njit(cache=True)로 컴파일
+  nogil=True → cmd_indicators가 여러 지표를 스레드로 동시에 계산할 수 있음
+  (numba 미설치 시 _njit.njit가 no-op → 같은 코드가 순수 Python으로 실행)
+- 0으로 나누는 경우는 NaN (numba/Python 모두 같은 결과가 나오도록 명시적으로 처리)
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from _njit import njit
+
+
+@njit(cache=True, nogil=True)
+def _rolling_mean_loop(x, period):
+    """단순 이동평균 (window 안에 NaN이 있으면 NaN)"""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    for i in range(period - 1, n):
+        s = 0.0
+        for j in range(i - period + 1, i + 1):
+            s += x[j]
+        out[i] = s / period
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _ema(x, span):
+    """지수이동평균 — pandas ewm(span=span, adjust=False).mean()과 동일 (첫 값으로 시작)"""
+    n = x.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    a = 2.0 / (span + 1.0)
+    out[0] = x[0]
+    for i in range(1, n):
+        out[i] = a * x[i] + (1.0 - a) * out[i - 1]
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _rsi_value(avg_gain, avg_loss):
+    if avg_loss > 0.0:
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return 100.0 if avg_gain > 0.0 else np.nan
+
+
+@njit(cache=True, nogil=True)
+def _rsi_loop(c, period):
+    """
+    RSI — Wilder smoothing (TA-Lib RSI와 같은 방식).
+    첫 period개 변화량의 평균으로 시작 → avg = (avg * (period - 1) + 값) / period
+    """
+    n = c.shape[0]
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        d = c[i] - c[i - 1]
+        if d > 0:
+            avg_gain += d
+        else:
+            avg_loss -= d
+    avg_gain /= period
+    avg_loss /= period
+    out[period] = _rsi_value(avg_gain, avg_loss)
+
+    for i in range(period + 1, n):
+        d = c[i] - c[i - 1]
+        avg_gain = (avg_gain * (period - 1) + (d if d > 0 else 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + (-d if d < 0 else 0.0)) / period
+        out[i] = _rsi_value(avg_gain, avg_loss)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _macd_loop(c, fast, slow, signal):
+    """
+    MACD, Signal, Histogram — 세 EMA(adjust=False)의 점화식을 한 번의 루프로.
+    (_ema를 세 번 부르는 것과 같은 값, 중간 배열 없이)
+    """
+    n = c.shape[0]
+    macd = np.empty(n)
+    sig = np.empty(n)
+    hist = np.empty(n)
+    if n == 0:
+        return macd, sig, hist
+    a_fast = 2.0 / (fast + 1.0)
+    a_slow = 2.0 / (slow + 1.0)
+    a_sig = 2.0 / (signal + 1.0)
+    e_fast = c[0]
+    e_slow = c[0]
+    s = 0.0
+    for i in range(n):
+        if i > 0:
+            e_fast = a_fast * c[i] + (1.0 - a_fast) * e_fast
+            e_slow = a_slow * c[i] + (1.0 - a_slow) * e_slow
+        m = e_fast - e_slow
+        s = m if i == 0 else a_sig * m + (1.0 - a_sig) * s
+        macd[i] = m
+        sig[i] = s
+        hist[i] = m - s
+    return macd, sig, hist
+
+
+@njit(cache=True, nogil=True)
+def _bb_loop(c, period, k):
+    """볼린저 밴드 (표준편차 ddof=1) → upper, middle, lower"""
+    n = c.shape[0]
+    upper = np.full(n, np.nan)
+    middle = _rolling_mean_loop(c, period)
+    lower = np.full(n, np.nan)
+    for i in range(period - 1, n):
+        m = middle[i]
+        ss = 0.0
+        for j in range(i - period + 1, i + 1):
+            ss += (c[j] - m) ** 2
+        sd = np.sqrt(ss / (period - 1))
+        upper[i] = m + k * sd
+        lower[i] = m - k * sd
+    return upper, middle, lower
+
+
+@njit(cache=True, nogil=True)
+def _obv_loop(c, v):
+    """
+    OBV — 전일 대비 종가 방향으로 거래량 누적.
+    diff → sign → v*sign → cumsum 4단계를 한 번의 루프로 (중간 배열 없음)
+    """
+    n = c.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    out[0] = 0.0
+    acc = 0.0
+    for i in range(1, n):
+        if c[i] > c[i - 1]:
+            acc += v[i]
+        elif c[i] < c[i - 1]:
+            acc -= v[i]
+        out[i] = acc
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _stoch_loop(h, l, c, k_period, slowk_period, slowd_period):
+    """Slow Stochastic → slow %K, slow %D"""
+    n = c.shape[0]
+    fastk = np.full(n, np.nan)
+    for i in range(k_period - 1, n):
+        lo = l[i]
+        hi = h[i]
+        for j in range(i - k_period + 1, i):
+            if l[j] < lo:
+                lo = l[j]
+            if h[j] > hi:
+                hi = h[j]
+        if hi > lo:
+            fastk[i] = (c[i] - lo) / (hi - lo) * 100.0
+    slowk = _rolling_mean_loop(fastk, slowk_period)
+    slowd = _rolling_mean_loop(slowk, slowd_period)
+    return slowk, slowd
+
+
+@njit(cache=True, nogil=True)
+def _atr_loop(h, l, c, period):
+    """ATR — True Range의 단순 이동평균"""
+    n = c.shape[0]
+    tr = np.empty(n)
+    for i in range(n):
+        r = h[i] - l[i]
+        if i > 0:
+            r = max(r, abs(h[i] - c[i - 1]), abs(l[i] - c[i - 1]))
+        tr[i] = r
+    return _rolling_mean_loop(tr, period)
+
+
+@njit(cache=True, nogil=True)
+def _cci_loop(h, l, c, period):
+    """CCI — (TP - SMA(TP)) / (0.015 * 평균절대편차)"""
+    n = c.shape[0]
+    tp = (h + l + c) / 3.0
+    out = np.full(n, np.nan)
+    for i in range(period - 1, n):
+        s = 0.0
+        for j in range(i - period + 1, i + 1):
+            s += tp[j]
+        m = s / period
+        md = 0.0
+        for j in range(i - period + 1, i + 1):
+            md += abs(tp[j] - m)
+        md /= period
+        if md > 0.0:
+            out[i] = (tp[i] - m) / (0.015 * md)
+    return out
+
+
+def _rolling_mean(x, period):
+    """_rolling_mean_loop의 numpy 벡터 버전 — window view 위 mean 한 번 (numba 미설치 시 사용)"""
+    out = np.full(x.shape[0], np.nan)
+    if x.shape[0] >= period:
+        out[period - 1:] = sliding_window_view(x, period).mean(axis=1)
+    return out
+
+
+def _wma(x, period):
+    """
+    선형 가중 이동평균 (최근 값일수록 가중치 큼, TA-Lib WMA와 동일).
+    window view (n - period + 1, period) @ 가중치 벡터 → 행렬-벡터 곱 한 번.
+    """
+    out = np.full(x.shape[0], np.nan)
+    if x.shape[0] >= period:
+        w = np.arange(1, period + 1, dtype=np.float64)
+        w /= w.sum()
+        out[period - 1:] = sliding_window_view(x, period) @ w
+    return out
+
+
+def _atr_np(h, l, c, period):
+    """
+    _atr_loop의 numpy 벡터 버전 (numba 미설치 시 사용).
+    True Range = max(H-L, |H-전일C|, |L-전일C|) 를 np.maximum 두 번으로, 첫날은 H-L.
+    """
+    prev_c = np.concatenate((c[:1], c[:-1]))
+    tr = np.maximum(np.maximum(h - l, np.abs(h - prev_c)), np.abs(l - prev_c))
+    return _rolling_mean(tr, period)
+
+
+def _cci_swv(h, l, c, period):
+    """
+    _cci_loop의 numpy 벡터 버전 (numba 미설치 시 사용).
+    sliding_window_view (복사 없는 2차원 view) 위에서 평균/평균절대편차를 한 번에 계산.
+    """
+    tp = (h + l + c) / 3.0
+    out = np.full(tp.shape[0], np.nan)
+    if tp.shape[0] < period:
+        return out
+    w = sliding_window_view(tp, period)
+    m = w.mean(axis=1)
+    md = np.abs(w - m[:, None]).mean(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[period - 1:] = np.where(md > 0.0, (tp[period - 1:] - m) / (0.015 * md), np.nan)
+    return out
@@ -0,0 +1,21 @@
+# backend/scripts/_njit.py
+"""
+numba njit 래퍼 — numba 미설치 시 데코레이터가 원본 함수를 그대로 반환.
+
+    from _njit import njit, HAS_NUMBA
+
+    @njit(cache=True)
+    def _loop(x): ...
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # numba 미설치 → 순수 Python 루프로 실행
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        # @njit / @njit(cache=True) 둘 다 지원
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
@@ -15,6 +15,12 @@ TA-Lib 설치 전에도 FDR/pykrx 테스트 가능.
     # 거래대금/시가총액 확인
     python scripts/collect_stock_data.py market_cap 005930
 
+    # 조회 결과는 ~/.cache/stock/*.parquet 에 캐시 (지난 날짜/기간만, 종목 리스트는 24시간)
+    # 캐시 무시: python scripts/collect_stock_data.py --no-cache ohlcv 005930
+
+    # (선택) TA-Lib 없이 보조지표 계산 시 JIT 워밍업 제거 — numba로 커널 AOT 빌드
+    python scripts/_build_indicators.py
+
     # 보조지표 계산 테스트
     python scripts/collect_stock_data.py indicators 005930 --indicators RSI,MACD,BB
 
@@ -23,20 +29,170 @@ TA-Lib 설치 전에도 FDR/pykrx 테스트 가능.
 """
 
 import argparse
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
 
+import FinanceDataReader as fdr
+import numpy as np
 import pandas as pd
+from pykrx import stock as pykrx_stock
+
+from _njit import HAS_NUMBA
+from _indicators import (
+    _rolling_mean_loop, _rolling_mean, _wma, _rsi_loop, _macd_loop, _bb_loop, _obv_loop,
+    _stoch_loop, _atr_loop, _atr_np, _cci_loop, _cci_swv,
+)
+
+try:
+    # scripts/_build_indicators.py 로 미리 컴파일한 루프 커널 → JIT 워밍업 없음
+    from stock_indicators_native import (
+        _rolling_mean_loop, _rsi_loop, _macd_loop, _bb_loop, _obv_loop,
+        _stoch_loop, _atr_loop, _cci_loop,
+    )
+    KERNEL_BACKEND = "numba AOT"
+except ImportError:
+    KERNEL_BACKEND = "numba" if HAS_NUMBA else "Python"
+
+# 루프 커널이 컴파일돼 있으면(AOT/JIT) 루프 커널, 아니면 numpy 벡터 버전이 빠름
+COMPILED_KERNELS = KERNEL_BACKEND != "Python"
+# GIL을 놓는 건 njit(nogil=True) JIT 커널뿐 (pycc AOT 함수는 GIL을 잡고 실행)
+NOGIL_KERNELS = KERNEL_BACKEND == "numba"
+
+try:
+    import talib
+    HAS_TALIB = True
+except ImportError:  # TA-Lib 미설치 → _indicators fallback 커널 사용
+    talib = None
+    HAS_TALIB = False
+
+# KRX/FDR 응답 디스크 캐시 (같은 날짜/기간 재조회 시 HTTP 없이 parquet 읽기)
+CACHE_DIR = Path("~/.cache/stock").expanduser()
+USE_DISK_CACHE = True   # --no-cache 로 끔
+LISTING_TTL = 24 * 3600  # 종목 리스트는 하루 한 번만 새로 받음 (초)
+
+
+def _disk_cached(name: str, fetch, max_age=None):
+    """
+    CACHE_DIR/{name}.parquet 이 있으면 읽고, 없으면 fetch() 결과를 저장 후 반환.
+    max_age(초)를 주면 파일 수정 시각이 그보다 오래된 경우 다시 fetch()
+    (재조회 실패 시 오래된 캐시라도 반환).
+    parquet 엔진(pyarrow) 미설치/저장 실패 시 캐시 없이 fetch() 결과만 반환.
+    """
+    if not USE_DISK_CACHE:
+        return fetch()
+
+    path = CACHE_DIR / f"{name}.parquet"
+    stale = False
+    if path.exists():
+        stale = max_age is not None and time.time() - path.stat().st_mtime > max_age
+        if not stale:
+            try:
+                return pd.read_parquet(path)
+            except Exception as e:
+                print(f"   ⚠️ 캐시 읽기 실패 ({path.name}): {e}")
+
+    try:
+        df = fetch()
+    except Exception as e:
+        if not stale:
+            raise
+        print(f"   ⚠️ 재조회 실패 ({e}) → 이전 캐시 사용 ({path.name})")
+        return pd.read_parquet(path)
+    if df is not None and not df.empty:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(path)
+        except Exception as e:
+            print(f"   ⚠️ 캐시 저장 생략 ({path.name}): {e}")
+    return df
+
+
+def _save_frame(df, stem: str) -> str:
+    """
+    --save 출력: parquet(zstd)로 저장, pyarrow 미설치/변환 실패 시 CSV(utf-8-sig).
+    저장한 파일명 반환.
+    """
+    try:
+        filename = f"{stem}.parquet"
+        df.to_parquet(filename, compression="zstd", index=True)
+    except Exception:
+        filename = f"{stem}.csv"
+        df.to_csv(filename, encoding="utf-8-sig")
+    return filename
+
+
+def _align_by_date(src_index, src_values, target_index) -> np.ndarray:
+    """
+    src_values(src_index 날짜 기준)를 target_index 날짜에 맞춰 정렬 → float64 배열, 없는 날짜는 NaN.
+    양쪽을 자정 기준 datetime64 배열로 맞춘 뒤 정렬된 src에 searchsorted.
+    src에 같은 날짜가 여러 번이면 마지막 값만 사용 (서비스 sync_prices의 거래대금 정렬과 동일).
+    """
+    src_dates = pd.DatetimeIndex(src_index).normalize()
+    keep = ~src_dates.duplicated(keep="last")
+    src = src_dates[keep].to_numpy()
+    dst = pd.DatetimeIndex(target_index).normalize().to_numpy()
+    order = np.argsort(src, kind="stable")
+    src = src[order]
+    vals = np.asarray(src_values, dtype=np.float64)[keep][order]
+
+    out = np.full(dst.shape[0], np.nan)
+    if src.shape[0] == 0:
+        return out
+    pos = np.searchsorted(src, dst)
+    hit = pos < src.shape[0]
+    hit[hit] = src[pos[hit]] == dst[hit]
+    out[hit] = vals[pos[hit]]
+    return out
+
+
+def _is_closed(d: str) -> bool:
+    """오늘 이전 날짜 → 데이터가 더 바뀌지 않으므로 캐시 가능"""
+    return d.replace("-", "") < date.today().strftime("%Y%m%d")
+
+
+def _cached_listing(market: str):
+    """
+    종목 리스트 — market별 파일 하나, LISTING_TTL 동안 재다운로드 없음.
+    (FDR StockListing은 KRX POST/OTP 요청이라 ETag/Last-Modified 조건부 요청 불가
+     → 파일 수정 시각으로 신선도 판단)
+    """
+    return _disk_cached(
+        f"listing_{market}", lambda: fdr.StockListing(market), max_age=LISTING_TTL
+    )
+
+
+def _cached_market_cap(p_date: str, market: str = "ALL"):
+    """pykrx 전 종목 시가총액 — 지난 날짜만 캐시 (당일은 장중 값이 바뀜)"""
+    fetch = lambda: pykrx_stock.get_market_cap(p_date, market=market)
+    if not _is_closed(p_date):
+        return fetch()
+    return _disk_cached(f"mcap_{market}_{p_date}", fetch)
+
+
+@lru_cache(maxsize=512)
+def _fdr_read(code: str, start: str, end: str):
+    """
+    FDR 일봉 — 한 실행 안에서 같은 (code, start, end)는 메모리에서 재사용,
+    종료일이 지난 기간은 디스크에도 캐시.
+    반환 DataFrame은 공유 객체이므로 수정할 때는 .copy() 후 사용.
+    """
+    fetch = lambda: fdr.DataReader(code, start, end)
+    if not _is_closed(end):
+        return fetch()
+    return _disk_cached(f"ohlcv_{code}_{start}_{end}", fetch)
 
 
 def cmd_listing(args):
     """KRX 종목 리스트 조회"""
-    import FinanceDataReader as fdr
-
     market = args.market or "KRX"
     print(f"\n📋 {market} 종목 리스트 조회 중...")
 
-    df = fdr.StockListing(market)
+    df = _cached_listing(market)
     print(f"   총 {len(df)}개 종목\n")
 
     # 상위 20개 출력
@@ -45,15 +201,12 @@ def cmd_listing(args):
     print(df[available_cols].head(args.limit or 20).to_string())
 
     if args.save:
-        filename = f"listing_{market}_{date.today().isoformat()}.csv"
-        df.to_csv(filename, encoding="utf-8-sig")
+        filename = _save_frame(df, f"listing_{market}_{date.today().isoformat()}")
         print(f"\n💾 저장: {filename}")
 
 
 def cmd_ohlcv(args):
     """개별 종목 OHLCV + pykrx 거래대금"""
-    import FinanceDataReader as fdr
-    from pykrx import stock as pykrx_stock
 
     code = args.code
     start = args.start or (date.today() - timedelta(days=90)).isoformat()
@@ -61,20 +214,24 @@ def cmd_ohlcv(args):
 
     print(f"\n📈 {code} 일봉 데이터 ({start} ~ {end})")
 
-    # 1) FDR OHLCV
-    print("   [FDR] OHLCV 수집 중...")
-    fdr_df = fdr.DataReader(code, start, end)
-    print(f"   [FDR] {len(fdr_df)}일치 수집 완료")
-    print(f"\n   === FDR (수정주가 OHLCV) ===")
-    print(fdr_df.tail(10).to_string())
-
-    # 2) pykrx OHLCV (거래대금 포함)
+    # FDR / pykrx는 서로 다른 서버 → 두 요청을 동시에 보내고 결과를 기다림
     p_start = start.replace("-", "")
     p_end = end.replace("-", "")
-    print(f"\n   [pykrx] 거래대금 수집 중...")
+    print("   [FDR] OHLCV / [pykrx] 거래대금 수집 중...")
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_fdr = ex.submit(_fdr_read, code, start, end)
+        f_pykrx = ex.submit(pykrx_stock.get_market_ohlcv_by_date, p_start, p_end, code)
+
+        # 1) FDR OHLCV
+        fdr_df = f_fdr.result()
+        print(f"   [FDR] {len(fdr_df)}일치 수집 완료")
+        print(f"\n   === FDR (수정주가 OHLCV) ===")
+        print(fdr_df.tail(10).to_string())
+
+    # 2) pykrx OHLCV (거래대금 포함)
     try:
-        pykrx_df = pykrx_stock.get_market_ohlcv_by_date(p_start, p_end, code)
-        print(f"   [pykrx] {len(pykrx_df)}일치 수집 완료")
+        pykrx_df = f_pykrx.result()
+        print(f"\n   [pykrx] {len(pykrx_df)}일치 수집 완료")
         print(f"\n   === pykrx (거래대금 포함) ===")
         print(pykrx_df.tail(10).to_string())
     except Exception as e:
@@ -83,28 +240,24 @@ def cmd_ohlcv(args):
 
     # 3) 데이터 병합 미리보기
     if pykrx_df is not None and not pykrx_df.empty:
+        # 양쪽 날짜를 datetime64로 맞춘 뒤 searchsorted 한 번으로 정렬
         merged = fdr_df.copy()
-        merged["거래대금"] = None
-        for idx in merged.index:
-            d = idx.date() if hasattr(idx, 'date') else idx
-            if d in pykrx_df.index:
-                merged.loc[idx, "거래대금"] = pykrx_df.loc[d, "거래대금"]
-            elif idx in pykrx_df.index:
-                merged.loc[idx, "거래대금"] = pykrx_df.loc[idx, "거래대금"]
+        # 없는 날짜(NaN) 때문에 float64가 된 값을 nullable 정수로 (1.0e+09 대신 정수 출력)
+        merged["거래대금"] = pd.Series(
+            _align_by_date(pykrx_df.index, pykrx_df["거래대금"].to_numpy(), merged.index),
+            index=merged.index,
+        ).astype("Int64")
 
         print(f"\n   === 병합 결과 (FDR OHLCV + pykrx 거래대금) ===")
         print(merged.tail(10).to_string())
 
     if args.save:
-        filename = f"ohlcv_{code}_{start}_{end}.csv"
-        fdr_df.to_csv(filename, encoding="utf-8-sig")
+        filename = _save_frame(fdr_df, f"ohlcv_{code}_{start}_{end}")
         print(f"\n💾 저장: {filename}")
 
 
 def cmd_market_cap(args):
     """시가총액, 상장주식수 조회"""
-    from pykrx import stock as pykrx_stock
-
     code = args.code
     target_date = args.date or date.today().isoformat()
     p_date = target_date.replace("-", "")
@@ -115,7 +268,7 @@ def cmd_market_cap(args):
         # 개별 종목
         print(f"   종목: {code}")
         try:
-            cap_df = pykrx_stock.get_market_cap(p_date, market="ALL")
+            cap_df = _cached_market_cap(p_date, "ALL")
             if code in cap_df.index:
                 row = cap_df.loc[code]
                 print(f"\n   시가총액:   {int(row['시가총액']):>20,}원")
@@ -130,17 +283,27 @@ def cmd_market_cap(args):
         # 전체 상위 20
         print("   전체 종목 (시가총액 상위 20)")
         try:
-            cap_df = pykrx_stock.get_market_cap(p_date, market="ALL")
+            cap_df = _cached_market_cap(p_date, "ALL")
             cap_df = cap_df.sort_values("시가총액", ascending=False).head(20)
             print(cap_df.to_string())
         except Exception as e:
             print(f"   ❌ 실패: {e}")
 
 
+# 지표별 필요한 과거 거래일 수 (window 길이, EMA/Wilder 계열은 초기값 수렴 구간 포함)
+LOOKBACK = {
+    "MA": 120, "WMA": 120, "MACD": 100, "RSI": 60, "BB": 20, "CCI": 20,
+    "STOCH": 20, "ATR": 14, "ADX": 40, "WILLR": 14, "OBV": 1,
+}
+
+
+def _lookback_days(indicators) -> int:
+    """요청 지표에 필요한 lookback (달력일). 주말/휴일 감안 거래일 × 2 + 여유 10일"""
+    return max((LOOKBACK.get(ind, 0) for ind in indicators), default=0) * 2 + 10
+
+
 def cmd_indicators(args):
     """보조지표 계산 테스트"""
-    import FinanceDataReader as fdr
-
     code = args.code
     start = args.start or (date.today() - timedelta(days=365)).isoformat()
     end = args.end or date.today().isoformat()
@@ -149,152 +312,119 @@ def cmd_indicators(args):
     print(f"\n📊 {code} 보조지표 계산 ({start} ~ {end})")
     print(f"   지표: {', '.join(indicators)}")
 
-    # OHLCV 수집 (lookback 포함)
+    # OHLCV 수집 (요청 지표에 필요한 만큼만 lookback)
     lookback_start = (
-        pd.Timestamp(start) - pd.Timedelta(days=300)
+        pd.Timestamp(start) - pd.Timedelta(days=_lookback_days(indicators))
     ).strftime("%Y-%m-%d")
 
-    df = fdr.DataReader(code, lookback_start, end)
+    df = _fdr_read(code, lookback_start, end).copy()  # 아래에서 지표 컬럼 추가
     if df.empty:
         print("   ⚠️ 데이터 없음")
         return
 
     print(f"   데이터: {len(df)}일치 (lookback 포함)")
 
-    import numpy as np
+    def _col(name):
+        """컬럼 → float64 연속 배열. 이미 float64/연속이면 복사 없이 view 그대로"""
+        a = df[name].to_numpy(copy=False)
+        if a.dtype == np.float64 and a.flags.c_contiguous:
+            return a
+        return np.ascontiguousarray(a, dtype=np.float64)
 
-    c = df["Close"].values.astype(np.float64)
-    h = df["High"].values.astype(np.float64)
-    l = df["Low"].values.astype(np.float64)
-    v = df["Volume"].values.astype(np.float64)
+    # 가격/거래량은 여기서 한 번만 float64 연속 배열로 → 아래 지표 분기는 ndarray만 사용
+    c = _col("Close")
+    h = _col("High")
+    l = _col("Low")
+    v = _col("Volume")   # FDR Volume은 int64 → 여기서만 변환 복사
 
-    try:
-        import talib
-        has_talib = True
+    if HAS_TALIB:
         print("   ✅ TA-Lib 사용")
-    except ImportError:
-        has_talib = False
-        print("   ⚠️ TA-Lib 미설치 → pandas 기반 계산")
-
-    results = {}
-
-    for ind in indicators:
-        print(f"\n   ── {ind} ──")
+    else:
+        print(f"   ⚠️ TA-Lib 미설치 → {KERNEL_BACKEND} 루프 기반 계산")
 
+    def _calc(ind):
+        """
+        지표 하나 계산 → [(df 컬럼명 또는 None, 값 배열, 출력 라벨, 출력 포맷)].
+        계산할 수 없는 지표는 출력할 메시지 문자열.
+        """
         if ind == "MA":
-            for p in [5, 20, 60, 120]:
-                if has_talib:
-                    ma = talib.SMA(c, timeperiod=p)
-                else:
-                    ma = pd.Series(c).rolling(p).mean().values
-                df[f"MA{p}"] = ma
-                last_val = ma[-1]
-                print(f"   MA{p}: {last_val:,.0f}" if not np.isnan(last_val) else f"   MA{p}: N/A")
-
-        elif ind == "RSI":
-            period = 14
-            if has_talib:
-                rsi = talib.RSI(c, timeperiod=period)
-            else:
-                delta = pd.Series(c).diff()
-                gain = delta.where(delta > 0, 0).rolling(period).mean()
-                loss = (-delta.where(delta < 0, 0)).rolling(period).mean()
-                rs = gain / loss
-                rsi = (100 - (100 / (1 + rs))).values
-            df["RSI"] = rsi
-            print(f"   RSI({period}): {rsi[-1]:.2f}" if not np.isnan(rsi[-1]) else "   RSI: N/A")
-
-        elif ind == "MACD":
-            if has_talib:
-                macd, signal, hist = talib.MACD(c, 12, 26, 9)
-            else:
-                exp1 = pd.Series(c).ewm(span=12).mean()
-                exp2 = pd.Series(c).ewm(span=26).mean()
-                macd = (exp1 - exp2).values
-                signal = pd.Series(macd).ewm(span=9).mean().values
-                hist = macd - signal
-            df["MACD"] = macd
-            df["Signal"] = signal
-            df["Hist"] = hist
-            print(f"   MACD: {macd[-1]:,.2f}")
-            print(f"   Signal: {signal[-1]:,.2f}")
-            print(f"   Histogram: {hist[-1]:,.2f}")
-
-        elif ind == "BB":
-            if has_talib:
-                upper, middle, lower = talib.BBANDS(c, 20, 2, 2)
-            else:
-                ma20 = pd.Series(c).rolling(20).mean()
-                std20 = pd.Series(c).rolling(20).std()
-                upper = (ma20 + 2 * std20).values
-                middle = ma20.values
-                lower = (ma20 - 2 * std20).values
-            df["BB_Upper"] = upper
-            df["BB_Middle"] = middle
-            df["BB_Lower"] = lower
-            print(f"   Upper: {upper[-1]:,.0f}")
-            print(f"   Middle: {middle[-1]:,.0f}")
-            print(f"   Lower: {lower[-1]:,.0f}")
-
-        elif ind == "OBV":
-            if has_talib:
-                obv = talib.OBV(c, v)
-            else:
-                direction = np.sign(np.diff(c, prepend=c[0]))
-                obv = np.cumsum(v * direction)
-            df["OBV"] = obv
-            print(f"   OBV: {obv[-1]:,.0f}")
-
-        elif ind == "STOCH":
-            if has_talib:
-                slowk, slowd = talib.STOCH(h, l, c, 14, 3, 0, 3, 0)
+            if HAS_TALIB:
+                sma = lambda p: talib.SMA(c, timeperiod=p)
             else:
-                low14 = pd.Series(l).rolling(14).min()
-                high14 = pd.Series(h).rolling(14).max()
-                fastk = ((pd.Series(c) - low14) / (high14 - low14) * 100)
-                slowk = fastk.rolling(3).mean().values
-                slowd = pd.Series(slowk).rolling(3).mean().values
-            print(f"   Slow %K: {slowk[-1]:.2f}")
-            print(f"   Slow %D: {slowd[-1]:.2f}")
-
-        elif ind == "ATR":
-            if has_talib:
+                # 컴파일된 커널이 없으면 window view 벡터 연산 (4개 기간 모두 같은 c 위의 zero-copy view)
+                sma = (lambda p: _rolling_mean_loop(c, p)) if COMPILED_KERNELS else (lambda p: _rolling_mean(c, p))
+            return [(f"MA{p}", sma(p), f"MA{p}", ",.0f") for p in (5, 20, 60, 120)]
+        if ind == "WMA":
+            wma = (lambda p: talib.WMA(c, timeperiod=p)) if HAS_TALIB else (lambda p: _wma(c, p))
+            return [(f"WMA{p}", wma(p), f"WMA{p}", ",.0f") for p in (5, 20, 60, 120)]
+        if ind == "RSI":
+            rsi = talib.RSI(c, timeperiod=14) if HAS_TALIB else _rsi_loop(c, 14)
+            return [("RSI", rsi, "RSI(14)", ".2f")]
+        if ind == "MACD":
+            macd, signal, hist = talib.MACD(c, 12, 26, 9) if HAS_TALIB else _macd_loop(c, 12, 26, 9)
+            return [
+                ("MACD", macd, "MACD", ",.2f"),
+                ("Signal", signal, "Signal", ",.2f"),
+                ("Hist", hist, "Histogram", ",.2f"),
+            ]
+        if ind == "BB":
+            upper, middle, lower = talib.BBANDS(c, 20, 2, 2) if HAS_TALIB else _bb_loop(c, 20, 2.0)
+            return [
+                ("BB_Upper", upper, "Upper", ",.0f"),
+                ("BB_Middle", middle, "Middle", ",.0f"),
+                ("BB_Lower", lower, "Lower", ",.0f"),
+            ]
+        if ind == "OBV":
+            obv = talib.OBV(c, v) if HAS_TALIB else _obv_loop(c, v)
+            return [("OBV", obv, "OBV", ",.0f")]
+        if ind == "STOCH":
+            slowk, slowd = (
+                talib.STOCH(h, l, c, 14, 3, 0, 3, 0) if HAS_TALIB else _stoch_loop(h, l, c, 14, 3, 3)
+            )
+            return [(None, slowk, "Slow %K", ".2f"), (None, slowd, "Slow %D", ".2f")]
+        if ind == "ATR":
+            if HAS_TALIB:
                 atr = talib.ATR(h, l, c, 14)
             else:
-                tr1 = pd.Series(h) - pd.Series(l)
-                tr2 = abs(pd.Series(h) - pd.Series(c).shift(1))
-                tr3 = abs(pd.Series(l) - pd.Series(c).shift(1))
-                tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-                atr = tr.rolling(14).mean().values
-            print(f"   ATR(14): {atr[-1]:,.0f}")
-
-        elif ind == "ADX":
-            if has_talib:
-                adx = talib.ADX(h, l, c, 14)
-                print(f"   ADX(14): {adx[-1]:.2f}")
-            else:
-                print("   ADX: TA-Lib 필요")
-
-        elif ind == "CCI":
-            if has_talib:
+                atr = _atr_loop(h, l, c, 14) if COMPILED_KERNELS else _atr_np(h, l, c, 14)
+            return [(None, atr, "ATR(14)", ",.0f")]
+        if ind == "ADX":
+            if not HAS_TALIB:
+                return "ADX: TA-Lib 필요"
+            return [(None, talib.ADX(h, l, c, 14), "ADX(14)", ".2f")]
+        if ind == "CCI":
+            if HAS_TALIB:
                 cci = talib.CCI(h, l, c, 20)
-                print(f"   CCI(20): {cci[-1]:.2f}")
-            else:
-                tp = (pd.Series(h) + pd.Series(l) + pd.Series(c)) / 3
-                ma20 = tp.rolling(20).mean()
-                md = tp.rolling(20).apply(lambda x: abs(x - x.mean()).mean())
-                cci = ((tp - ma20) / (0.015 * md)).values
-                print(f"   CCI(20): {cci[-1]:.2f}")
-
-        elif ind == "WILLR":
-            if has_talib:
-                willr = talib.WILLR(h, l, c, 14)
-                print(f"   Williams %R: {willr[-1]:.2f}")
             else:
-                print("   Williams %R: TA-Lib 필요")
+                # 컴파일 안 된 Python 이중 루프보다 stride view 벡터 연산이 빠름
+                cci = _cci_loop(h, l, c, 20) if COMPILED_KERNELS else _cci_swv(h, l, c, 20)
+            return [(None, cci, "CCI(20)", ".2f")]
+        if ind == "WILLR":
+            if not HAS_TALIB:
+                return "Williams %R: TA-Lib 필요"
+            return [(None, talib.WILLR(h, l, c, 14), "Williams %R", ".2f")]
+        return f"⚠️ 미지원: {ind}"
+
+    # 지표끼리는 독립 → JIT(nogil) 커널이면 스레드로 동시 계산
+    # TA-Lib / AOT / 순수 Python 경로는 GIL 때문에 스레드가 직렬화되므로 순서대로 계산
+    if NOGIL_KERNELS and not HAS_TALIB and len(indicators) > 1:
+        workers = min(len(indicators), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            computed = list(ex.map(_calc, indicators))
+    else:
+        computed = [_calc(ind) for ind in indicators]
 
-        else:
-            print(f"   ⚠️ 미지원: {ind}")
+    # 출력/DataFrame 반영은 입력 순서대로
+    for ind, res in zip(indicators, computed):
+        print(f"\n   ── {ind} ──")
+        if isinstance(res, str):
+            print(f"   {res}")
+            continue
+        for col, values, label, fmt in res:
+            if col:
+                df[col] = values
+            last_val = values[-1]
+            print(f"   {label}: {last_val:{fmt}}" if not np.isnan(last_val) else f"   {label}: N/A")
 
     # 결과 테이블 (최근 10일)
     trim_df = df[df.index >= start]
@@ -306,45 +436,67 @@ def cmd_indicators(args):
         print(trim_df[available].tail(10).to_string())
 
 
+# ─── CLI ──────────────────────────────────────────────────
+def _add_listing_parser(sub):
+    p = sub.add_parser("listing", help="종목 리스트 조회")
+    p.add_argument("--market", default="KRX", help="KRX/KOSPI/KOSDAQ/NASDAQ/NYSE")
+    p.add_argument("--limit", type=int, default=20)
+    p.add_argument("--save", action="store_true")
+
+
+def _add_ohlcv_parser(sub):
+    p = sub.add_parser("ohlcv", help="일봉 OHLCV 수집")
+    p.add_argument("code", help="종목코드 (예: 005930)")
+    p.add_argument("--start", help="시작일 (YYYY-MM-DD)")
+    p.add_argument("--end", help="종료일")
+    p.add_argument("--save", action="store_true")
+
+
+def _add_market_cap_parser(sub):
+    p = sub.add_parser("market_cap", help="시가총액 조회")
+    p.add_argument("code", nargs="?", help="종목코드 (없으면 상위 20)")
+    p.add_argument("--date", help="조회일 (YYYY-MM-DD)")
+
+
+def _add_indicators_parser(sub):
+    p = sub.add_parser("indicators", help="보조지표 계산")
+    p.add_argument("code", help="종목코드")
+    p.add_argument("--indicators", default="MA,RSI,MACD,BB,OBV", help="지표 (쉼표 구분)")
+    p.add_argument("--start", help="시작일")
+    p.add_argument("--end", help="종료일")
+
+
+# 명령어 → (subparser 생성, 실행 함수)
+COMMANDS = {
+    "listing": (_add_listing_parser, cmd_listing),
+    "ohlcv": (_add_ohlcv_parser, cmd_ohlcv),
+    "market_cap": (_add_market_cap_parser, cmd_market_cap),
+    "indicators": (_add_indicators_parser, cmd_indicators),
+}
+
+
 def main():
     parser = argparse.ArgumentParser(description="주식 데이터 수집 CLI")
+    parser.add_argument("--no-cache", action="store_true", help="캐시된 조회 결과 무시 (새로 조회)")
     sub = parser.add_subparsers(dest="command", help="명령어")
 
-    # listing
-    p_list = sub.add_parser("listing", help="종목 리스트 조회")
-    p_list.add_argument("--market", default="KRX", help="KRX/KOSPI/KOSDAQ/NASDAQ/NYSE")
-    p_list.add_argument("--limit", type=int, default=20)
-    p_list.add_argument("--save", action="store_true")
-
-    # ohlcv
-    p_ohlcv = sub.add_parser("ohlcv", help="일봉 OHLCV 수집")
-    p_ohlcv.add_argument("code", help="종목코드 (예: 005930)")
-    p_ohlcv.add_argument("--start", help="시작일 (YYYY-MM-DD)")
-    p_ohlcv.add_argument("--end", help="종료일")
-    p_ohlcv.add_argument("--save", action="store_true")
-
-    # market_cap
-    p_cap = sub.add_parser("market_cap", help="시가총액 조회")
-    p_cap.add_argument("code", nargs="?", help="종목코드 (없으면 상위 20)")
-    p_cap.add_argument("--date", help="조회일 (YYYY-MM-DD)")
-
-    # indicators
-    p_ind = sub.add_parser("indicators", help="보조지표 계산")
-    p_ind.add_argument("code", help="종목코드")
-    p_ind.add_argument("--indicators", default="MA,RSI,MACD,BB,OBV", help="지표 (쉼표 구분)")
-    p_ind.add_argument("--start", help="시작일")
-    p_ind.add_argument("--end", help="종료일")
-
-    args = parser.parse_args()
-
-    if args.command == "listing":
-        cmd_listing(args)
-    elif args.command == "ohlcv":
-        cmd_ohlcv(args)
-    elif args.command == "market_cap":
-        cmd_market_cap(args)
-    elif args.command == "indicators":
-        cmd_indicators(args)
+    # 실행할 명령어의 subparser만 생성 (명령어 없음/오타 → help용으로 전부 생성)
+    argv = sys.argv[1:]
+    name = next((a for a in argv if not a.startswith("-")), None)
+    builders = [COMMANDS[name][0]] if name in COMMANDS else [b for b, _ in COMMANDS.values()]
+    for build in builders:
+        build(sub)
+
+    args = parser.parse_args(argv)
+
+    if args.no_cache:
+        # 디스크 캐시 끄기 + lru_cache 래퍼도 우회 → 매 호출 새로 조회
+        global USE_DISK_CACHE, _fdr_read
+        USE_DISK_CACHE = False
+        _fdr_read = _fdr_read.__wrapped__
+
+    if args.command in COMMANDS:
+        COMMANDS[args.command][1](args)
     else:
         parser.print_help()
 
@@ -0,0 +1,30 @@
+# backend/tests/test_stock_router.py
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import stock
+
+CATALOG = {"MA": {"params": {"periods": [5, 20, 60, 120]}}}
+
+
+def test_indicator_catalog_not_shadowed_by_stock_code(monkeypatch):
+    """/indicators/catalog가 /indicators/{stock_code}로 매칭되지 않아야 함"""
+    monkeypatch.setattr(
+        stock.TechnicalIndicatorService, "get_catalog", staticmethod(lambda: CATALOG)
+    )
+    app = FastAPI()
+    app.include_router(stock.router)
+    client = TestClient(app)
+
+    resp = client.get("/stock/indicators/catalog")
+
+    assert resp.status_code == 200
+    assert resp.json() == CATALOG
+    assert resp.headers["ETag"]
+    assert resp.headers["Cache-Control"] == "public, max-age=86400"
+
+    # 같은 ETag로 재요청 → 304
+    cached = client.get(
+        "/stock/indicators/catalog", headers={"If-None-Match": resp.headers["ETag"]}
+    )
+    assert cached.status_code == 304